@@ -38,6 +38,9 @@ class Config:
         # XPath定数
         REMOVE_BUTTON_XPATH: str = "//span[contains(text(), 'Chrome から削除') or contains(text(), 'Remove from Chrome')]/.."
         ADD_BUTTON_XPATH: str = "//span[contains(text(), 'Chrome に追加') or contains(text(), 'Add to Chrome')]/.."
+        # 削除・追加ボタンのどちらかに一致（1回の探索でインストール状態を判定）
+        INSTALL_STATE_BUTTON_XPATH: str = f"{REMOVE_BUTTON_XPATH} | {ADD_BUTTON_XPATH}"
+        REMOVE_BUTTON_TEXTS: tuple[str, ...] = ("Chrome から削除", "Remove from Chrome")
 
     CONFIG_DIR: Path = Path.home() /  ".planning-reception-avatar"
 
@@ -32,6 +32,9 @@ class CommunicationServer:
         self.socket: socket.socket | None = None
         self.running = False
         self.server_thread: threading.Thread | None = None
+        # サーバー停止の通知用（停止中はセット状態）
+        self._stopped_event = threading.Event()
+        self._stopped_event.set()
 
         # メッセージハンドラー
         self.message_handlers: dict[str, Callable[[dict[str, Any]], None]] = {}
@@ -80,6 +83,7 @@ class CommunicationServer:
             self.socket.listen(5)
 
             self.running = True
+            self._stopped_event.clear()
             logger.info(f"サーバー開始: {self.host}:{self.port}")
 
             # 別スレッドでサーバー実行
@@ -221,6 +225,7 @@ class CommunicationServer:
         """サーバーを停止"""
         logger.info("サーバー停止中...")
         self.running = False
+        self._stopped_event.set()
 
         if self.socket:
             try:
@@ -247,6 +252,10 @@ class CommunicationServer:
         """サーバーが動作中かを確認"""
         return self.running
 
+    def wait_until_stopped(self, timeout: float | None = None) -> bool:
+        """サーバーが停止するまでブロック（タイムアウト時はFalse）"""
+        return self._stopped_event.wait(timeout)
+
     def __enter__(self) -> "CommunicationServer":
         """コンテキストマネージャーのエントリ"""
         self.start_server()
@@ -25,7 +25,6 @@ class MeetParticipant:
     """Google Meet参加管理クラス"""
 
     # 待機時間設定（最適化済み）
-    PAGE_LOAD_WAIT = 1.5
     BUTTON_WAIT_TIMEOUT = 15
     POPUP_WAIT = 90
 
@@ -91,8 +90,8 @@ class MeetParticipant:
             if not self.driver:
                 self.setup_browser()
 
+            # 名前入力欄の出現はWebDriverWaitで待機する
             self.driver.get(meet_url)
-            time.sleep(self.PAGE_LOAD_WAIT)
 
             # フロントPCは常にゲストとして参加
             return self._join_as_guest()
@@ -357,8 +357,8 @@ class ReceptionHandler:
         """リクエスト待機"""
         try:
             logger.info("受付待機中... (Ctrl+Cで終了)")
-            while self.server.is_running():
-                time.sleep(1)
+            # 停止まで定期的に起床せずに待機
+            self.server.wait_until_stopped()
 
         except KeyboardInterrupt:
             logger.info("終了要求を受信")
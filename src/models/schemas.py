@@ -73,3 +73,11 @@ class GUIState(BaseModel):
 
     status: ConnectionStatus
     connected_device: str | None = None
+
+
+class SessionHealth(BaseModel):
+    """Meetセッションの状態スナップショット"""
+
+    chrome_alive: bool
+    meet_joined: bool
+    checked_at: float = Field(description="取得時刻（time.monotonic）")
@@ -0,0 +1,42 @@
+"""
+通信クライアントプール（リモートPC用）
+フロントPCごとにCommunicationClientを1つだけ保持し、
+セッションをまたいでTCP接続を再利用する
+"""
+
+import atexit
+import logging
+import threading
+
+from .communication_client import CommunicationClient
+
+logger = logging.getLogger(__name__)
+
+_clients: dict[str, CommunicationClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(front_pc_name: str, port: int = 9999) -> CommunicationClient:
+    """フロントPCごとの共有CommunicationClientを取得（接続はconnect()時に行う）"""
+    key = f"{front_pc_name}:{port}"
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = CommunicationClient(front_pc_name, port)
+            _clients[key] = client
+            logger.info(f"通信クライアントを作成: {key}")
+        return client
+
+
+def shutdown() -> None:
+    """保持しているすべての接続を閉じる"""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+
+    for client in clients:
+        client.disconnect(reuse=False)
+    CommunicationClient.close_pooled_connections()
+
+
+atexit.register(shutdown)
@@ -9,16 +9,36 @@ import logging
 import socket
 import threading
 import time
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
-from ..models.enums import MessageType
+from ..models.enums import MessageType, RemoteCommand
 from ..utils.tailscale_utils import TailscaleUtils
 
 # ロギング設定
 logger = logging.getLogger(__name__)
 
 
+def _encode_frame(message_data: dict[str, Any]) -> bytes:
+    """メッセージを長さプレフィックス付きのフレームにエンコード"""
+    message_bytes = json.dumps(message_data, ensure_ascii=False).encode("utf-8")
+    return len(message_bytes).to_bytes(4, "big") + message_bytes
+
+
+# 内容が固定のメッセージは事前にエンコードしておく
+# （フロントPCはheartbeat・commandのtimestampを参照しないため省略する）
+_HEARTBEAT_FRAME = _encode_frame(
+    {"type": "notification", "content": MessageType.HEARTBEAT.value}
+)
+_COMMAND_FRAMES = {
+    command.value: _encode_frame(
+        {"type": "command", "content": command.value, "params": {}}
+    )
+    for command in RemoteCommand
+}
+
+
 class CommunicationClient:
     """フロントPCとの通信を管理するクライアント"""
 
@@ -30,6 +50,13 @@ class CommunicationClient:
     _device_cache = {}  # デバイス名からIPへのキャッシュ
     _cache_lock = threading.Lock()
     TAILSCALE_CHECK_INTERVAL = 300  # 5分間はTailscale確認をスキップ
+    # TCPキープアライブ設定（秒・回数）
+    KEEPALIVE_IDLE = 10
+    KEEPALIVE_INTERVAL = 5
+    KEEPALIVE_COUNT = 3
+
+    # フロントPCは30秒無通信のクライアントを切断するため、それ以上空いた接続は使わない
+    SERVER_IDLE_TIMEOUT = 30
 
     def __init__(
         self,
@@ -54,6 +81,8 @@ class CommunicationClient:
         self.socket: socket.socket | None = None
         self.front_pc_ip: str | None = None
         self._pool_key = f"{front_pc_name}:{port}"
+        self._on_disconnect_callback: Callable[[], None] | None = None
+        self._last_tx = 0.0  # 最後に送信に成功した時刻（time.monotonic）
 
         # 事前接続を非同期で実行
         if pre_connect:
@@ -127,20 +156,35 @@ class CommunicationClient:
         with self._pool_lock:
             if self._pool_key in self._connection_pool:
                 sock = self._connection_pool.pop(self._pool_key)
-                # 接続が有効かテスト（高速化のため最小限のチェック）
-                try:
-                    # ソケットの状態を確認
-                    sock.setblocking(False)
-                    with contextlib.suppress(BlockingIOError):
-                        # 0バイト送信で接続状態を確認
-                        sock.send(b"")
-                    sock.setblocking(True)
+                if self._is_socket_alive(sock):
                     return sock
-                except Exception:
-                    with contextlib.suppress(Exception):
-                        sock.close()
+                with contextlib.suppress(Exception):
+                    sock.close()
             return None
 
+    @staticmethod
+    def _is_socket_alive(sock: socket.socket) -> bool:
+        """ソケットが相手側から切断されていないかを確認（ブロックしない）
+
+        読み残しの応答（遅れて届いたACKなど）は破棄する。残しておくと次の送信で
+        古い応答を自分の応答として読んでしまうため。
+        """
+        try:
+            timeout = sock.gettimeout()
+            sock.setblocking(False)
+            try:
+                while True:
+                    # 相手が切断済みなら（読み残しの後に）空バイトが読める
+                    if sock.recv(4096) == b"":
+                        return False
+            except BlockingIOError:
+                # 読み取るデータがない＝接続は維持されている
+                return True
+            finally:
+                sock.settimeout(timeout)
+        except Exception:
+            return False
+
     def _return_to_pool(self) -> None:
         """接続をプールに戻す"""
         if self.socket:
@@ -164,8 +208,19 @@ class CommunicationClient:
             self.socket.settimeout(self.timeout)
             self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
-            # SO_KEEPALIVE を設定して接続の健全性を保つ
+            # SO_KEEPALIVE を設定して接続の健全性をカーネル側で確認させる
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for option, value in (
+                ("TCP_KEEPIDLE", self.KEEPALIVE_IDLE),
+                ("TCP_KEEPINTVL", self.KEEPALIVE_INTERVAL),
+                ("TCP_KEEPCNT", self.KEEPALIVE_COUNT),
+            ):
+                # 対応していないプラットフォームではOS既定値のままにする
+                if hasattr(socket, option):
+                    with contextlib.suppress(OSError):
+                        self.socket.setsockopt(
+                            socket.IPPROTO_TCP, getattr(socket, option), value
+                        )
 
             self.socket.connect((self.front_pc_ip, self.port))
             return True
@@ -178,6 +233,16 @@ class CommunicationClient:
     def connect(self) -> bool:
         """フロントPCに接続（最適化版）"""
         try:
+            # release()で保持している接続がまだ有効ならそのまま使う
+            if self.socket:
+                if (
+                    self.idle_time() < self.SERVER_IDLE_TIMEOUT
+                    and self._is_socket_alive(self.socket)
+                ):
+                    logger.info("保持中の接続を再利用")
+                    return True
+                self._cleanup_socket()
+
             # プールから接続を再利用
             self.socket = self._get_pooled_connection()
             if self.socket:
@@ -214,13 +279,35 @@ class CommunicationClient:
 
     def send_command(self, command: str, params: dict[str, Any] | None = None) -> bool:
         """コマンドをフロントPCに送信"""
-        message_data = {
-            "type": "command",
-            "content": command,
-            "timestamp": datetime.now().isoformat(),
-            "params": params or {},
-        }
-        return self._send_json_message(message_data)
+        return self._send_command(command, params)
+
+    def send_command_sync(
+        self,
+        command: str,
+        params: dict[str, Any] | None = None,
+        ack_timeout: float = 1.0,
+    ) -> bool:
+        """コマンドを送信し、フロントPCの受信確認を待ってから戻る"""
+        return self._send_command(command, params, ack_timeout=ack_timeout)
+
+    def _send_command(
+        self,
+        command: str,
+        params: dict[str, Any] | None = None,
+        ack_timeout: float = 0.1,
+    ) -> bool:
+        """コマンドを送信（パラメータなしの既知コマンドは事前エンコード済みを使用）"""
+        frame = None if params else _COMMAND_FRAMES.get(command)
+        if frame is None:
+            frame = _encode_frame(
+                {
+                    "type": "command",
+                    "content": command,
+                    "timestamp": datetime.now().isoformat(),
+                    "params": params or {},
+                }
+            )
+        return self._send_frame(frame, f"command - {command}", ack_timeout)
 
     def send_notification(self, message: str) -> bool:
         """通知メッセージをフロントPCに送信"""
@@ -231,26 +318,42 @@ class CommunicationClient:
         }
         return self._send_json_message(message_data)
 
-    def _send_json_message(self, message_data: dict[str, Any]) -> bool:
-        """JSON形式でメッセージを送信（最適化版）"""
+    def _send_json_message(
+        self, message_data: dict[str, Any], ack_timeout: float = 0.1
+    ) -> bool:
+        """JSON形式でメッセージを送信（最適化版）
+
+        Args:
+            message_data: 送信するメッセージ
+            ack_timeout: 受信確認を待つ最大時間（秒）。経過後は成功とみなす
+        """
+        try:
+            frame = _encode_frame(message_data)
+        except Exception as e:
+            logger.error(f"メッセージ送信エラー: {e}")
+            return False
+        return self._send_frame(
+            frame,
+            f"{message_data.get('type')} - {message_data.get('content')}",
+            ack_timeout,
+        )
+
+    def _send_frame(self, frame: bytes, label: str, ack_timeout: float = 0.1) -> bool:
+        """エンコード済みのフレームを送信し、受信確認を短時間待つ"""
+        # 未接続時は送信せずにFalseを返す（呼び出し側で事前確認は不要）
         if not self.socket:
-            logger.error("ソケットが接続されていません")
+            logger.warning("ソケットが接続されていません")
             return False
 
         try:
-            json_message = json.dumps(message_data, ensure_ascii=False)
-            message_bytes = json_message.encode("utf-8")
-
-            # メッセージ長を送信してからメッセージを送信
-            self.socket.sendall(len(message_bytes).to_bytes(4, "big"))
-            self.socket.sendall(message_bytes)
+            # 長さプレフィックスとメッセージをまとめて1回で送信
+            self.socket.sendall(frame)
 
-            logger.info(
-                f"メッセージ送信: {message_data.get('type')} - {message_data.get('content')}"
-            )
+            self._last_tx = time.monotonic()
+            logger.info(f"メッセージ送信: {label}")
 
-            # 応答受信を非同期化（ブロックしない）
-            self.socket.settimeout(0.1)  # より短いタイムアウト
+            # 応答受信は短いタイムアウトで待つ（ブロックしない）
+            self.socket.settimeout(ack_timeout)
             try:
                 response_length = int.from_bytes(self.socket.recv(4), "big")
                 if response_length > 0:
@@ -266,10 +369,27 @@ class CommunicationClient:
 
             return True
 
+        except OSError as e:
+            logger.error(f"メッセージ送信エラー: {e}")
+            self._handle_connection_lost()
+            return False
         except Exception as e:
             logger.error(f"メッセージ送信エラー: {e}")
             return False
 
+    def set_disconnect_callback(self, callback: Callable[[], None]) -> None:
+        """通信切断時のコールバックを設定"""
+        self._on_disconnect_callback = callback
+
+    def _handle_connection_lost(self) -> None:
+        """送信失敗で切断を検知した場合の処理"""
+        self._cleanup_socket()
+        if self._on_disconnect_callback:
+            try:
+                self._on_disconnect_callback()
+            except Exception as e:
+                logger.error(f"切断コールバックエラー: {e}")
+
     def is_connected(self) -> bool:
         """接続状態を確認"""
         return self.socket is not None
@@ -286,7 +406,24 @@ class CommunicationClient:
 
     def send_heartbeat(self) -> bool:
         """ハートビート信号を送信して接続を維持"""
-        return self.send_notification(MessageType.HEARTBEAT.value)
+        return self._send_frame(
+            _HEARTBEAT_FRAME, f"notification - {MessageType.HEARTBEAT.value}"
+        )
+
+    def idle_time(self) -> float:
+        """最後に送信に成功してからの経過時間（秒）"""
+        return time.monotonic() - self._last_tx
+
+    def send_heartbeat_if_idle(self, min_gap: float = 20) -> bool:
+        """直近min_gap秒以内に送信がなかった場合のみハートビートを送信"""
+        if self.socket and self.idle_time() < min_gap:
+            return True
+        return self.send_heartbeat()
+
+    def release(self) -> None:
+        """セッション終了時に接続を保持したまま解放（次回のconnect()で再利用）"""
+        if self.socket and not self._is_socket_alive(self.socket):
+            self._cleanup_socket()
 
     def disconnect(self, reuse: bool = True) -> None:
         """接続を切断またはプールに戻す"""
@@ -325,6 +462,16 @@ class CommunicationClient:
         cls._tailscale_check_time = 0
         logger.info("キャッシュをクリアしました")
 
+    @classmethod
+    def close_pooled_connections(cls) -> None:
+        """プール中の接続をすべて閉じる"""
+        with cls._pool_lock:
+            sockets = list(cls._connection_pool.values())
+            cls._connection_pool.clear()
+        for sock in sockets:
+            with contextlib.suppress(Exception):
+                sock.close()
+
     @classmethod
     def preload_devices(cls, device_names: list[str]):
         """デバイス名を事前に解決してキャッシュ"""
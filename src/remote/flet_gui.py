@@ -495,41 +495,39 @@ class RemoteGUI:
 
         manager = PrecheckManager()
 
-        # Auto-Admitチェック
+        # Googleログインと拡張機能を1つのブラウザの別タブで並列に確認
         try:
-            result = manager.check_extension(
-                "https://chromewebstore.google.com/detail/auto-admit-for-google-mee/epemkdedgaoeeobdjmkmhhhbjemckmgb",
-                "Auto-Admit",
+            login_result, results = manager.run_prechecks(
+                PrecheckManager.REQUIRED_EXTENSIONS
             )
-            self.check_states["auto_admit"] = result
-            if self.page:
-                self.auto_admit_status.value = (
-                    "✓ インストール済み" if result else "✗ 未インストール"
-                )
-                self.auto_admit_status.color = Colors.GREEN if result else Colors.ERROR
-                self.auto_admit_button.visible = not result
-                self.page.update()
         except Exception as e:
-            self.add_log(f"Auto-Admitチェックエラー: {str(e)}")
+            self.add_log(f"事前チェックエラー: {str(e)}")
             self._set_extension_error("auto_admit")
-
-        # Googleログインチェック
-        try:
-            manager = PrecheckManager()
-            result = manager.check_google_login()
-            self.check_states["google_login"] = result
-            if self.page:
-                self.google_login_status.value = (
-                    "✓ ログイン済み" if result else "✗ 未ログイン"
-                )
-                self.google_login_status.color = (
-                    Colors.GREEN if result else Colors.ERROR
-                )
-                self.google_login_button.visible = not result
-                self.page.update()
-        except Exception as e:
-            self.add_log(f"Googleログインチェックエラー: {str(e)}")
             self._set_login_error()
+            return
+
+        # Auto-Admit
+        result = results["Auto-Admit"]
+        self.check_states["auto_admit"] = result
+        if self.page:
+            self.auto_admit_status.value = (
+                "✓ インストール済み" if result else "✗ 未インストール"
+            )
+            self.auto_admit_status.color = Colors.GREEN if result else Colors.ERROR
+            self.auto_admit_button.visible = not result
+            self.page.update()
+
+        # Googleログイン
+        self.check_states["google_login"] = login_result
+        if self.page:
+            self.google_login_status.value = (
+                "✓ ログイン済み" if login_result else "✗ 未ログイン"
+            )
+            self.google_login_status.color = (
+                Colors.GREEN if login_result else Colors.ERROR
+            )
+            self.google_login_button.visible = not login_result
+            self.page.update()
 
     def _set_extension_error(self, extension_type: str) -> None:
         """拡張機能チェックエラー時の処理"""
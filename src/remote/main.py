@@ -42,8 +42,8 @@ def main():
                 def monitor_session():
                     nonlocal controller
                     controller.wait_for_session_end()
-                    # セッション終了後の処理
-                    controller.cleanup()
+                    # セッション終了後の処理（GUIは続けて使うため次回分を準備する）
+                    controller.cleanup(prefetch_next=True)
                     controller = None
 
                 monitor_thread = threading.Thread(target=monitor_session, daemon=True)
@@ -67,7 +67,7 @@ def main():
         nonlocal controller
         if controller:
             gui.add_log("セッションを終了しています...")
-            controller.cleanup()
+            controller.cleanup(prefetch_next=True)
             controller = None
 
     gui.set_connect_callback(connect_to_front)
@@ -81,6 +81,7 @@ def main():
     finally:
         if controller:
             controller.cleanup()
+        ReceptionController.shutdown_pool()
         logger.info("プログラムを終了します")
 
 
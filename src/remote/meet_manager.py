@@ -7,6 +7,7 @@ import logging
 import threading
 import time
 from collections.abc import Callable
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Any
 
@@ -18,15 +19,16 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions
 from selenium.webdriver.support.ui import WebDriverWait
 
 from ..config import Config
+from ..models.schemas import SessionHealth
 from .webdriver_manager import (
     cleanup_webdriver,
     get_webdriver,
-    get_webdriver_chrome_pid,
-    is_webdriver_active,
+    get_webdriver_chrome_process,
     release_webdriver,
 )
 
@@ -41,23 +43,91 @@ class MeetManager:
 
     # 待機時間設定
     BUTTON_WAIT_TIMEOUT = 10
+    IMPLICIT_WAIT = 2
+    HEALTH_CHECK_MAX_AGE = 5  # 状態スナップショットを再利用する期間（秒）
+
+    # URLとホーム画面ボタンの有無を1回のWebDriver呼び出しで取得する
+    _HEALTH_SCRIPT = (
+        "return [window.location.href, "
+        "document.documentElement.outerHTML.includes(arguments[0])];"
+    )
+
+    # 認証情報キャッシュ（全インスタンス共有）
+    _cached_creds: Credentials | None = None
+
+    # 次のセッション用に事前作成したMeetスペース（全インスタンス共有）
+    PREFETCH_WAIT_TIMEOUT = 10
+    _prefetched_url: Future[str] | None = None
+    _prefetch_lock = threading.Lock()
 
     def __init__(self):
         self.driver: webdriver.Chrome | None = None
         self.meet_url: str | None = None
         self.creds: Any = None
+        self._spaces_client: meet_v2.SpacesServiceClient | None = None
         self._process_monitor_thread: threading.Thread | None = None
         self._monitoring = False
         self._on_chrome_exit_callback: Callable[[], None] | None = None
+        self._chrome_process: psutil.Process | None = None
+        self._last_health: SessionHealth | None = None
 
     def create_meet_space(self) -> str:
-        """Google Meet APIを使用して新しいMeetスペースを作成"""
+        """Google Meet APIを使用して新しいMeetスペースを作成（事前作成分があれば使用）"""
+        prefetched_url = self._take_prefetched_url()
+        if prefetched_url:
+            return prefetched_url
+        return self._create_meet_space()
+
+    def prefetch_meet_space(self) -> None:
+        """次のセッション用のMeetスペースをバックグラウンドで作成しておく"""
+        creds = MeetManager._cached_creds
+        # ブラウザでの認証が必要になる場合は事前作成しない
+        if creds is None or not (creds.valid or creds.refresh_token):
+            return
+
+        with MeetManager._prefetch_lock:
+            if MeetManager._prefetched_url is not None:
+                return
+            future: Future[str] = Future()
+            MeetManager._prefetched_url = future
+
+        def _prefetch() -> None:
+            try:
+                future.set_result(self._create_meet_space())
+            except Exception as e:
+                future.set_exception(e)
+
+        threading.Thread(target=_prefetch, daemon=True).start()
+        logger.info("次のセッション用のMeetスペースを事前作成中...")
+
+    def _take_prefetched_url(self) -> str | None:
+        """事前作成したMeetスペースのURLを取り出す（なければNone）"""
+        with MeetManager._prefetch_lock:
+            future = MeetManager._prefetched_url
+            MeetManager._prefetched_url = None
+        if future is None:
+            return None
+
+        try:
+            meet_url = future.result(timeout=self.PREFETCH_WAIT_TIMEOUT)
+            logger.info("事前作成したMeetスペースを使用します")
+            return meet_url
+        except Exception as e:
+            logger.warning(f"事前作成したMeetスペースを使用できません: {e}")
+            return None
+
+    def _create_meet_space(self) -> str:
+        """Google Meet APIでMeetスペースを作成"""
         self._authenticate()
 
         try:
-            client = meet_v2.SpacesServiceClient(credentials=self.creds)
+            if self._spaces_client is None:
+                # CreateSpaceを1回呼ぶだけなのでgRPCチャネルより軽量なRESTを使う
+                self._spaces_client = meet_v2.SpacesServiceClient(
+                    credentials=self.creds, transport="rest"
+                )
             request = meet_v2.CreateSpaceRequest()
-            response = client.create_space(request=request)
+            response = self._spaces_client.create_space(request=request)
             meet_url = response.meeting_uri
             return meet_url
         except Exception:
@@ -65,12 +135,16 @@ class MeetManager:
             raise
 
     def _authenticate(self) -> None:
-        """Google APIの認証処理"""
+        """Google APIの認証処理（有効な認証情報はプロセス内でキャッシュ）"""
+        creds = MeetManager._cached_creds
+        if creds and creds.valid:
+            self.creds = creds
+            return
+
         token_path = Config.CONFIG_DIR / "token.json"
         credentials_path = Path(__file__).parent.parent.parent / "credentials.json"
 
-        creds = None
-        if token_path.exists():
+        if creds is None and token_path.exists():
             creds = Credentials.from_authorized_user_file(str(token_path), self.SCOPES)
 
         if not creds or not creds.valid:
@@ -90,6 +164,7 @@ class MeetManager:
             with open(token_path, "w") as token:
                 token.write(creds.to_json())
 
+        MeetManager._cached_creds = creds
         self.creds = creds
 
     def setup_browser(self) -> None:
@@ -98,11 +173,19 @@ class MeetManager:
         try:
             # 共有WebDriverインスタンスを取得
             self.driver = get_webdriver(headless=False)
+            # 要素探索のポーリングをブラウザ側で行う
+            self.driver.implicitly_wait(self.IMPLICIT_WAIT)
             logger.info("共有WebDriverインスタンスを取得しました")
         except Exception as e:
             logger.error(f"共有WebDriverの取得に失敗: {e}")
             raise
 
+    def _find(self, xpath: str) -> WebElement:
+        """クリック可能になるまで待機して要素を取得"""
+        return WebDriverWait(self.driver, self.BUTTON_WAIT_TIMEOUT).until(
+            expected_conditions.element_to_be_clickable((By.XPATH, xpath))
+        )
+
     def join_as_host(self, meet_url: str) -> None:
         """Meetにホストとして参加"""
         if not self.driver:
@@ -111,20 +194,12 @@ class MeetManager:
         self.driver.get(meet_url)
 
         # 参加ボタンをクリック
-        join_button = None
         try:
-            join_button = WebDriverWait(self.driver, self.BUTTON_WAIT_TIMEOUT).until(
-                expected_conditions.element_to_be_clickable(
-                    (By.XPATH, Config.GoogleMeet.JOIN_BUTTON_XPATH)
-                )
-            )
+            join_button = self._find(Config.GoogleMeet.JOIN_BUTTON_XPATH)
         except TimeoutException:
-            join_button = None
+            raise TimeoutException("参加ボタンが見つかりませんでした") from None
 
-        if join_button:
-            join_button.click()
-        else:
-            raise TimeoutException("参加ボタンが見つかりませんでした")
+        join_button.click()
 
     def enable_auto_admit(self) -> None:
         """Auto-Admit機能を有効化"""
@@ -133,47 +208,60 @@ class MeetManager:
 
         logger.info("Auto-Admit機能を有効化中...")
 
-        auto_admit_button = None
         try:
-            auto_admit_button = WebDriverWait(
-                self.driver, self.BUTTON_WAIT_TIMEOUT
-            ).until(
-                expected_conditions.element_to_be_clickable(
-                    (By.XPATH, Config.GoogleMeet.AUTO_ADMIT_BUTTON_XPATH)
-                )
-            )
+            auto_admit_button = self._find(Config.GoogleMeet.AUTO_ADMIT_BUTTON_XPATH)
         except TimeoutException:
-            auto_admit_button = None
+            logger.warning("Auto-Admitボタンが見つかりませんでした")
+            return
 
-        if auto_admit_button:
-            is_pressed = auto_admit_button.get_attribute("aria-pressed") == "true"
-            if not is_pressed:
-                auto_admit_button.click()
-                logger.info("Auto-Admit機能を有効にしました")
-            else:
-                logger.info("Auto-Admit機能は既に有効です")
+        is_pressed = auto_admit_button.get_attribute("aria-pressed") == "true"
+        if not is_pressed:
+            auto_admit_button.click()
+            logger.info("Auto-Admit機能を有効にしました")
         else:
-            logger.warning("Auto-Admitボタンが見つかりませんでした")
+            logger.info("Auto-Admit機能は既に有効です")
 
     def is_session_active(self) -> bool:
         """Chromeとセッションが有効かどうかを確認"""
+        return self.health_snapshot().meet_joined
+
+    def health_snapshot(self, max_age_s: float = HEALTH_CHECK_MAX_AGE) -> SessionHealth:
+        """Chromeプロセスとセッションの状態をまとめて取得（一定時間キャッシュ）"""
+        now = time.monotonic()
+        if (
+            self._last_health is not None
+            and now - self._last_health.checked_at < max_age_s
+        ):
+            return self._last_health
+
+        chrome_alive = self.driver is not None and self._is_chrome_process_alive()
+        meet_joined = False
+        if chrome_alive:
+            try:
+                current_url, has_home_button = self.driver.execute_script(
+                    self._HEALTH_SCRIPT, Config.GoogleMeet.HOME_BUTTON_TEXT
+                )
+                # Meetから退出するとホーム画面に戻るボタンが表示される
+                meet_joined = "meet.google.com" in current_url and not has_home_button
+            except Exception:
+                # ChromeDriverが終了している場合やその他のエラー
+                chrome_alive = False
+
+        self._last_health = SessionHealth(
+            chrome_alive=chrome_alive, meet_joined=meet_joined, checked_at=now
+        )
+        return self._last_health
+
+    def _is_chrome_process_alive(self) -> bool:
+        """キャッシュしたプロセスハンドルでChromeの生存を確認"""
+        if self._chrome_process is None:
+            self._chrome_process = self._get_chrome_process()
+        if self._chrome_process is None:
+            # PIDが取得できない場合はWebDriver呼び出しの結果に任せる
+            return True
         try:
-            if not self.driver:
-                return False
-
-            # ChromeDriverが終了していないかチェック
-            _ = self.driver.current_url
-
-            # ページタイトルやURLでMeetから退出していないかチェック
-            current_url = self.driver.current_url
-            if "meet.google.com" not in current_url:
-                return False
-
-            # ページが会議画面から外れていないかチェック（ホーム画面に戻る ってソースにあるか）
-            return Config.GoogleMeet.HOME_BUTTON_TEXT not in self.driver.page_source
-
-        except Exception:
-            # ChromeDriverが終了している場合やその他のエラー
+            return self._chrome_process.status() != psutil.STATUS_ZOMBIE
+        except psutil.NoSuchProcess:
             return False
 
     def set_chrome_exit_callback(self, callback: Callable[[], None]) -> None:
@@ -185,6 +273,8 @@ class MeetManager:
 
         if not self._monitoring:
             self._monitoring = True
+            # 監視対象のプロセスハンドルは一度だけ生成して使い回す
+            self._chrome_process = self._get_chrome_process()
             self._process_monitor_thread = threading.Thread(
                 target=self._monitor_chrome_process, daemon=True
             )
@@ -196,42 +286,27 @@ class MeetManager:
         self._monitoring = False
         if self._process_monitor_thread and self._process_monitor_thread.is_alive():
             self._process_monitor_thread.join(timeout=2)
+        self._chrome_process = None
+        self._last_health = None
         logger.info("Chromeプロセス監視を停止しました")
 
+    def _get_chrome_process(self) -> psutil.Process | None:
+        """監視対象のChromeプロセスハンドルを取得"""
+        return get_webdriver_chrome_process()
+
     def _monitor_chrome_process(self) -> None:
         """Chromeプロセスを監視"""
 
         while self._monitoring:
             try:
-                # 共有WebDriverの状態チェック
-                if not is_webdriver_active():
-                    logger.info("共有WebDriverが終了しました")
+                health = self.health_snapshot(max_age_s=0)
+                if not health.chrome_alive:
+                    logger.info("Chromeプロセスが終了しました")
                     if self._on_chrome_exit_callback:
                         self._on_chrome_exit_callback()
                     break
 
-                # PIDによるプロセス監視
-                chrome_pid = get_webdriver_chrome_pid()
-                if chrome_pid:
-                    try:
-                        chrome_process = psutil.Process(chrome_pid)
-                        if not chrome_process.is_running():
-                            logger.info(
-                                f"Chromeプロセス (PID: {chrome_pid}) が終了しました"
-                            )
-                            if self._on_chrome_exit_callback:
-                                self._on_chrome_exit_callback()
-                            break
-                    except psutil.NoSuchProcess:
-                        logger.info(
-                            f"Chromeプロセス (PID: {chrome_pid}) が見つかりません"
-                        )
-                        if self._on_chrome_exit_callback:
-                            self._on_chrome_exit_callback()
-                        break
-
-                # Meetセッション状態チェック
-                if not self.is_session_active():
+                if not health.meet_joined:
                     logger.info("Meetセッションが終了しました")
                     if self._on_chrome_exit_callback:
                         self._on_chrome_exit_callback()
@@ -247,15 +322,27 @@ class MeetManager:
         """リソースのクリーンアップ"""
 
         self.stop_process_monitoring()
+        self._spaces_client = None
         if self.driver:
             try:
-                # 共有WebDriverの参照を解放
-                release_webdriver()
+                # GUIなど他の参照が残っていると待機処理が走らないため、
+                # 参照数に関係なく自分でMeetのページを離れて通話から退出する
+                self._leave_meet()
+                # 共有WebDriverの参照を解放（Chromeは次のセッションで再利用する）
+                release_webdriver(keep_alive=True)
                 self.driver = None
                 logger.info("MeetManagerのクリーンアップが完了しました")
             except Exception as e:
                 logger.error(f"クリーンアップエラー: {e}")
 
+    def _leave_meet(self) -> None:
+        """Meetのページから離れて通話を退出"""
+        try:
+            if self.driver and "meet.google.com" in self.driver.current_url:
+                self.driver.get("about:blank")
+        except Exception as e:
+            logger.error(f"Meet退出エラー: {e}")
+
     @classmethod
     def cleanup_shared_driver(cls) -> None:
         """共有ドライバーのクリーンアップ（互換性のため残す）"""
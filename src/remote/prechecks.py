@@ -1,17 +1,17 @@
 """事前チェック機能（拡張機能・Googleログイン確認）"""
 
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from selenium import webdriver
-from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from ..config import Config
-from .webdriver_manager import get_webdriver, release_webdriver
+from .webdriver_manager import get_webdriver, release_webdriver, webdriver_manager
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +19,30 @@ logger = logging.getLogger(__name__)
 class PrecheckManager:
     """事前チェック機能を管理するクラス（共有WebDriverを使用）"""
 
-    # 拡張機能のURL
-    AUTO_ADMIT_EXTENSION_URL = "https://chromewebstore.google.com/detail/auto-admit-for-google-mee/epemkdedgaoeeobdjmkmhhhbjemckmgb"
+    # 拡張機能のIDとURL
+    AUTO_ADMIT_EXTENSION_ID = "epemkdedgaoeeobdjmkmhhhbjemckmgb"
+    AUTO_ADMIT_EXTENSION_URL = f"https://chromewebstore.google.com/detail/auto-admit-for-google-mee/{AUTO_ADMIT_EXTENSION_ID}"
+
+    # 事前チェック対象の拡張機能（名前 -> URL）
+    REQUIRED_EXTENSIONS = {"Auto-Admit": AUTO_ADMIT_EXTENSION_URL}
+
+    # 事前チェックのページで読み込まないリソース
+    BLOCKED_RESOURCE_URLS = [
+        "*.png",
+        "*.jpg",
+        "*.jpeg",
+        "*.gif",
+        "*.webp",
+        "*.svg",
+        "*.woff",
+        "*.woff2",
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+    ]
+
+    # タブごとのチェックの待機設定
+    TAB_CHECK_TIMEOUT = 10
+    TAB_POLL_INTERVAL = 0.5
 
     def __init__(self):
         """初期化"""
@@ -37,6 +59,9 @@ class PrecheckManager:
         try:
             # 共有WebDriverインスタンスを取得
             self.driver = get_webdriver(headless=headless)
+            # 存在しない要素の探索で待たされないよう暗黙的待機を無効化
+            # （共有WebDriverにMeetManagerが設定した値が残っている場合がある）
+            self.driver.implicitly_wait(0)
             logger.info("共有WebDriverインスタンスを取得しました")
         except Exception as e:
             logger.error(f"共有WebDriverの取得に失敗: {e}")
@@ -52,8 +77,13 @@ class PrecheckManager:
                     logger.error("ドライバの初期化に失敗しました")
                     return False
 
+            # プロファイルに有効な認証Cookieがあればページを開かずに判定
+            if self._has_google_auth_cookie():
+                logger.info("✅ Googleアカウントにログイン済み（Cookie確認）")
+                return True
+
             self.driver.get("https://myaccount.google.com")
-            time.sleep(3)
+            self._wait_ready()
 
             # ログイン済みかチェック
             try:
@@ -79,54 +109,251 @@ class PrecheckManager:
 
         return False
 
+    def _wait_ready(self, timeout: float = 10) -> None:
+        """ページの読み込み完了 (document.readyState) まで待機"""
+        WebDriverWait(self.driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+
+    def _has_google_auth_cookie(self) -> bool:
+        """CDP経由で有効なGoogle認証Cookie (SID) が存在するか確認"""
+        try:
+            cookies = self.driver.execute_cdp_cmd("Network.getAllCookies", {})[
+                "cookies"
+            ]
+        except Exception as e:
+            logger.debug(f"Cookie取得に失敗（ページ確認にフォールバック）: {e}")
+            return False
+
+        now = time.time()
+        for cookie in cookies:
+            if cookie.get("name") != "SID" or cookie.get("domain") != ".google.com":
+                continue
+            # expiresが負の値の場合はセッションCookie
+            expires = cookie.get("expires", -1)
+            if expires < 0 or expires > now:
+                return True
+        return False
+
     def check_extension(self, extension_url: str, extension_name: str) -> bool:
         """拡張機能がインストールされているか確認"""
+        results = self.check_extensions({extension_name: extension_url})
+        return results.get(extension_name, False)
+
+    def check_extensions(self, extensions: dict[str, str]) -> dict[str, bool]:
+        """複数の拡張機能を別タブで並列に確認
+
+        Args:
+            extensions: 拡張機能名からChromeウェブストアURLへのマッピング
+
+        Returns:
+            拡張機能名ごとのインストール状態
+        """
+        _, results = self.run_prechecks(extensions, check_login=False)
+        return results
+
+    def run_prechecks(
+        self, extensions: dict[str, str], check_login: bool = True
+    ) -> tuple[bool, dict[str, bool]]:
+        """Googleログインと拡張機能の確認を1つのブラウザの別タブで並列に実行
+
+        Args:
+            extensions: 拡張機能名からChromeウェブストアURLへのマッピング
+            check_login: Googleログイン確認も行うか
+
+        Returns:
+            (login_ok, results): ログイン状態と拡張機能名ごとのインストール状態
+        """
+        login_ok = False
+        results = dict.fromkeys(extensions, False)
+
+        # プロファイル内に拡張機能フォルダがあればブラウザを使わずに判定する
+        pending: dict[str, str] = {}
+        for extension_name, extension_url in extensions.items():
+            if self._extension_dir_exists(self._extension_id(extension_url)):
+                logger.info(f"✅ {extension_name}拡張機能がインストール済み")
+                results[extension_name] = True
+            else:
+                pending[extension_name] = extension_url
+        extensions = pending
+
+        if not extensions and not check_login:
+            return login_ok, results
+
         try:
-            logger.info(f"{extension_name}拡張機能の確認中...")
+            logger.info("事前チェックを実行中...")
             if not self.driver:
                 self._setup_browser()
                 if not self.driver:
                     logger.error("ドライバの初期化に失敗しました")
-                    return False
-            # Chrome拡張機能ページを開く
-            self.driver.get(extension_url)
-            time.sleep(4)
+                    return login_ok, results
 
-            try:
-                WebDriverWait(self.driver, 3).until(
-                    EC.presence_of_element_located(
-                        (By.XPATH, Config.ChromeExtension.REMOVE_BUTTON_XPATH)
-                    )
-                )
-                logger.info(f"✅ {extension_name}拡張機能がインストール済み")
-                return True
-            except TimeoutException:
-                pass
+            # 有効な認証Cookieがあればログイン確認のタブは不要
+            need_login_tab = False
+            if check_login:
+                login_ok = self._has_google_auth_cookie()
+                if login_ok:
+                    logger.info("✅ Googleアカウントにログイン済み（Cookie確認）")
+                need_login_tab = not login_ok
 
-            # 「Chrome に追加」ボタンが存在するかチェック（未インストールの場合）
-            try:
-                WebDriverWait(self.driver, 3).until(
-                    EC.presence_of_element_located(
-                        (By.XPATH, Config.ChromeExtension.ADD_BUTTON_XPATH)
-                    )
-                )
-                logger.warning(
-                    f"❌ {extension_name}拡張機能がインストールされていません"
-                )
-                self.check_results["errors"].append(
-                    f"{extension_name}拡張機能をインストールしてください: {extension_url}"
+            # インストール済みの拡張機能はmanifest.jsonを直接開いて判定する
+            # （ストアページの読み込みが不要。判定できなかったものだけストアで確認）
+            pending: dict[str, str] = {}
+            for extension_name, extension_url in extensions.items():
+                if self._is_extension_installed(self._extension_id(extension_url)):
+                    logger.info(f"✅ {extension_name}拡張機能がインストール済み")
+                    results[extension_name] = True
+                else:
+                    pending[extension_name] = extension_url
+            extensions = pending
+
+            # チェックごとにタブを用意し、ページ読み込みを同時に開始する
+            main_handle = self.driver.current_window_handle
+            handles: list[str] = []
+            urls = (["https://myaccount.google.com"] if need_login_tab else []) + list(
+                extensions.values()
+            )
+            for url in urls:
+                if handles:
+                    self.driver.switch_to.new_window("tab")
+                handles.append(self.driver.current_window_handle)
+                # 判定に不要な画像・フォント・解析スクリプトは読み込まない
+                self._set_blocked_urls(self.BLOCKED_RESOURCE_URLS)
+                self.driver.execute_script("window.location.href = arguments[0];", url)
+
+            login_handle = handles.pop(0) if need_login_tab else None
+            driver_lock = threading.Lock()
+            with ThreadPoolExecutor(max_workers=max(len(urls), 1)) as executor:
+                login_future = (
+                    executor.submit(self._probe_login_tab, login_handle, driver_lock)
+                    if login_handle
+                    else None
                 )
-                return False
-            except TimeoutException:
-                pass
+                futures = {
+                    extension_name: executor.submit(
+                        self._probe_extension_tab,
+                        handle,
+                        extension_url,
+                        extension_name,
+                        driver_lock,
+                    )
+                    for (extension_name, extension_url), handle in zip(
+                        extensions.items(), handles, strict=True
+                    )
+                }
+                if login_future:
+                    login_ok = login_future.result()
+                for extension_name, future in futures.items():
+                    results[extension_name] = future.result()
+
+            # 追加したタブを閉じる
+            for handle in [login_handle, *handles]:
+                if handle and handle != main_handle:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+            self.driver.switch_to.window(main_handle)
+            self._set_blocked_urls([])
 
         except Exception as e:
-            logger.error(f"{extension_name}拡張機能確認中にエラー: {e}")
-            self.check_results["errors"].append(f"{extension_name}確認エラー: {e}")
-            return False
+            logger.error(f"事前チェック中にエラー: {e}")
+            self.check_results["errors"].append(f"事前チェックエラー: {e}")
         finally:
             self.cleanup()
 
+        return login_ok, results
+
+    def _set_blocked_urls(self, urls: list[str]) -> None:
+        """現在のタブで読み込みをブロックするURLパターンを設定（CDP）"""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+        except Exception as e:
+            logger.debug(f"リソースのブロック設定に失敗（無視）: {e}")
+
+    @staticmethod
+    def _extension_dir_exists(extension_id: str) -> bool:
+        """Chromeプロファイル内に拡張機能のフォルダが存在するか確認"""
+        return (
+            webdriver_manager.profile_dir / "Default" / "Extensions" / extension_id
+        ).is_dir()
+
+    @staticmethod
+    def _extension_id(extension_url: str) -> str:
+        """ChromeウェブストアURLから拡張機能IDを取得"""
+        return extension_url.rstrip("/").rsplit("/", 1)[-1]
+
+    def _is_extension_installed(self, extension_id: str) -> bool:
+        """拡張機能のmanifest.jsonを開けるかでインストール済みか判定"""
+        try:
+            self.driver.get(f"chrome-extension://{extension_id}/manifest.json")
+            if not self.driver.current_url.startswith("chrome-extension://"):
+                return False
+            body = self.driver.find_element(By.TAG_NAME, "body").text
+            return '"manifest_version"' in body
+        except Exception as e:
+            logger.debug(f"manifest.jsonによる判定に失敗（ストアで確認）: {e}")
+            return False
+
+    def _probe_login_tab(self, handle: str, driver_lock: threading.Lock) -> bool:
+        """指定タブの遷移先URLからログイン状態を判定"""
+        deadline = time.monotonic() + self.TAB_CHECK_TIMEOUT
+        while time.monotonic() < deadline:
+            with driver_lock:
+                self.driver.switch_to.window(handle)
+                current_url = self.driver.current_url
+                ready = (
+                    self.driver.execute_script("return document.readyState")
+                    == "complete"
+                )
+            if ready and current_url.startswith("http"):
+                if (
+                    "myaccount.google.com" in current_url
+                    and "signin" not in current_url
+                ):
+                    logger.info("✅ Googleアカウントにログイン済み")
+                    return True
+                break
+            time.sleep(self.TAB_POLL_INTERVAL)
+
+        logger.warning("❌ Googleアカウントにログインしていません")
+        self.check_results["errors"].append("Googleアカウントにログインしてください")
+        return False
+
+    def _probe_extension_tab(
+        self,
+        handle: str,
+        extension_url: str,
+        extension_name: str,
+        driver_lock: threading.Lock,
+    ) -> bool:
+        """指定タブでインストール状態を判定（ドライバ操作はロック下で行う）"""
+        deadline = time.monotonic() + self.TAB_CHECK_TIMEOUT
+        while time.monotonic() < deadline:
+            with driver_lock:
+                self.driver.switch_to.window(handle)
+                buttons = self.driver.find_elements(
+                    By.XPATH, Config.ChromeExtension.INSTALL_STATE_BUTTON_XPATH
+                )
+                if buttons:
+                    label = buttons[0].text
+                    if any(
+                        text in label
+                        for text in Config.ChromeExtension.REMOVE_BUTTON_TEXTS
+                    ):
+                        logger.info(f"✅ {extension_name}拡張機能がインストール済み")
+                        return True
+
+                    # 「Chrome に追加」ボタンのみ存在する場合は未インストール
+                    logger.warning(
+                        f"❌ {extension_name}拡張機能がインストールされていません"
+                    )
+                    self.check_results["errors"].append(
+                        f"{extension_name}拡張機能をインストールしてください: {extension_url}"
+                    )
+                    return False
+            time.sleep(self.TAB_POLL_INTERVAL)
+
+        logger.warning(f"{extension_name}拡張機能の状態を判定できませんでした")
         return False
 
     def cleanup(self) -> None:
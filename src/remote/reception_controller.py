@@ -4,7 +4,9 @@ Meet URL生成・送信とホスト処理を統合管理する
 """
 
 import logging
-import time
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 
 from ..models.enums import ConnectionStatus, RemoteCommand
 from ..utils.slack import (
@@ -15,7 +17,7 @@ from ..utils.slack import (
     notify_usage,
 )
 from ..utils.vtube_studio_utils import check_and_setup_vtube_studio
-from .communication_client import CommunicationClient
+from . import comm_pool
 from .flet_gui import RemoteGUI
 from .meet_manager import MeetManager
 from .webdriver_manager import cleanup_webdriver
@@ -23,9 +25,40 @@ from .webdriver_manager import cleanup_webdriver
 logger = logging.getLogger(__name__)
 
 
+class _GuiLogHandler(logging.Handler):
+    """ログレコードをGUIのログ欄に転送するハンドラー（反映は専用スレッドで行う）"""
+
+    def __init__(self, gui: RemoteGUI):
+        super().__init__(level=logging.INFO)
+        self.gui = gui
+        self._queue: queue.SimpleQueue[logging.LogRecord | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # 呼び出し側をブロックしないようキューに積むだけにする
+        self._queue.put_nowait(record)
+
+    def _drain(self) -> None:
+        """キューに積まれたログをGUIに反映（Noneで終了）"""
+        while (record := self._queue.get()) is not None:
+            try:
+                self.gui.add_log(record.getMessage())
+            except Exception:
+                self.handleError(record)
+
+    def close(self) -> None:
+        # 積まれたログを反映し終えたらスレッドを終了させる
+        self._queue.put_nowait(None)
+        super().close()
+
+
 class ReceptionController:
     """受付システムのメインコントローラー"""
 
+    # フロントPCは30秒無通信で切断するため、最終送信から20秒でハートビートを送る
+    HEARTBEAT_INTERVAL = 20
+
     def __init__(
         self,
         front_pc_ip: str,
@@ -43,38 +76,40 @@ class ReceptionController:
         self.gui = gui
         self.meet_manager = MeetManager()
 
-        # 最適化された通信クライアントを使用（デフォルト）
-        self.communication_client = CommunicationClient(front_pc_ip, port)
+        # セッション間で共有する通信クライアントを使用（接続を再利用する）
+        self.communication_client = comm_pool.get_client(front_pc_ip, port)
+        self.communication_client.set_disconnect_callback(self._handle_disconnect)
 
         self.current_meet_url: str | None = None
         self._session_ended: bool = False
+        self._session_end_event = threading.Event()
+        self._cleaned_up = False
 
-    def _update_gui(self, message: str) -> None:
-        """GUI更新（GUIがある場合のみ）"""
+        # コントローラーのログをGUIにも表示する
+        self._gui_log_handler: _GuiLogHandler | None = None
         if self.gui:
-            try:
-                self.gui.add_log(message)
-            except Exception as e:
-                logger.error(f"GUI更新エラー: {e}")
+            self._gui_log_handler = _GuiLogHandler(self.gui)
+            logger.addHandler(self._gui_log_handler)
+            # ロギング未設定時の既定レベル（WARNING）では進捗ログが届かないため
+            if logger.getEffectiveLevel() > logging.INFO:
+                logger.setLevel(logging.INFO)
 
     def _handle_chrome_exit(self) -> None:
         """Chrome終了時の処理"""
         logger.info("Chrome終了を検知しました")
-        self._update_gui("Chrome終了を検知しました")
         try:
-            # フロントPCに終了通知を送信
-            if self.communication_client.is_connected():
-                logger.info("フロントPCに終了通知を送信中...")
-                self.communication_client.send_command(RemoteCommand.END_SESSION.value)
-                time.sleep(1)  # 送信完了を待つ
+            # フロントPCに終了通知を送信（受信確認まで待つ・未接続なら何もしない）
+            logger.info("フロントPCに終了通知を送信中...")
+            self.communication_client.send_command_sync(RemoteCommand.END_SESSION.value)
 
-            # セッション終了フラグを立てる
+            # セッション終了フラグを立てて待機中のループを起こす
             self._session_ended = True
+            self._session_end_event.set()
 
             # GUI状態を更新
             if self.gui:
                 self.gui.update_status(ConnectionStatus.DISCONNECTING)
-                self.gui.add_log("Meetセッションを終了しています...")
+                logger.info("Meetセッションを終了しています...")
 
             # Meet終了通知を送信
             notify_meet_end(
@@ -83,7 +118,7 @@ class ReceptionController:
                 location=SessionLocation.REMOTE,
             )
         except Exception as e:
-            logger.error(f"Chrome終了処理エラー: {e}")
+            logger.error("Chrome終了処理エラー: %s", e)
             notify_error(
                 e,
                 "Chrome終了処理",
@@ -91,47 +126,61 @@ class ReceptionController:
                 location=SessionLocation.REMOTE,
             )
 
+    def _handle_disconnect(self) -> None:
+        """フロントPCとの通信切断時の処理"""
+        logger.warning("フロントPCとの通信が切断されました")
+        self._session_end_event.set()
+
     def start_reception_session(self) -> bool:
         """受付セッションを開始"""
+        startup_futures: list[Future] = []
         try:
             logger.info("受付セッションを開始します")
             self._session_ended = False
+            self._session_end_event.clear()
+            self._cleaned_up = False
 
-            # 0. VTube Studio状態確認
+            # 互いに依存しない起動処理（VTube Studio確認・Meet URL生成・
+            # フロントPC接続・ブラウザセットアップ）を並行して開始し、
+            # 結果が必要になる直前でそれぞれ待機する
             logger.info("VTube Studioの状態を確認中...")
-            self._update_gui("VTube Studioの状態を確認中...")
-            vtube_ok, vtube_message = check_and_setup_vtube_studio()
+            executor = ThreadPoolExecutor(max_workers=4)
+            vtube_future = executor.submit(check_and_setup_vtube_studio)
+            url_future = executor.submit(self.meet_manager.create_meet_space)
+            connect_future = executor.submit(self.communication_client.connect)
+            browser_future = executor.submit(self.meet_manager.setup_browser)
+            executor.shutdown(wait=False)
+            startup_futures = [vtube_future, url_future, connect_future, browser_future]
+
+            # 0. VTube Studio状態確認
+            vtube_ok, vtube_message = vtube_future.result()
             if not vtube_ok:
-                logger.error(f"VTube Studio確認失敗: {vtube_message}")
-                self._update_gui(f"VTube Studio確認失敗: {vtube_message}")
+                logger.error("VTube Studio確認失敗: %s", vtube_message)
+                self._abort_startup(startup_futures)
                 return False
-            logger.info(f"VTube Studio確認成功: {vtube_message}")
-            self._update_gui(f"VTube Studio確認成功: {vtube_message}")
+            logger.info("VTube Studio確認成功: %s", vtube_message)
 
             # 1. Meet URL生成
             logger.info("Meet URLを生成中...")
-            self._update_gui("Meet URLを生成中...")
-            self.current_meet_url = self.meet_manager.create_meet_space()
+            self.current_meet_url = url_future.result()
 
             # 2. フロントPCに接続
             logger.info("フロントPCに接続中...")
-            self._update_gui("フロントPCに接続中...")
-            if not self.communication_client.connect():
-                logger.error("フロントPCに接続できませんでした")
-                self._update_gui("フロントPCへの接続に失敗しました")
+            if not connect_future.result():
+                logger.error("フロントPCへの接続に失敗しました")
+                self._abort_startup(startup_futures)
                 return False
 
             # 3. Meet URLをフロントPCに送信
             logger.info("Meet URLをフロントPCに送信中...")
-            self._update_gui("Meet URLをフロントPCに送信中...")
             if not self.communication_client.send_meet_url(self.current_meet_url):
                 logger.error("Meet URL送信に失敗しました")
-                self._update_gui("Meet URL送信に失敗しました")
+                self._abort_startup(startup_futures)
                 return False
 
-            # 4. ブラウザセットアップ
+            # 4. ブラウザセットアップの完了を待機
             logger.info("ブラウザをセットアップ中...")
-            self.meet_manager.setup_browser()
+            browser_future.result()
 
             # Chrome終了時のコールバックを設定
             self.meet_manager.set_chrome_exit_callback(self._handle_chrome_exit)
@@ -140,9 +189,7 @@ class ReceptionController:
             logger.info("Meetにホストとして参加中...")
             self.meet_manager.join_as_host(self.current_meet_url)
 
-            time.sleep(2)  # 少し待機してから次の処理へ
-
-            # 8. Auto-Admit機能有効化
+            # 8. Auto-Admit機能有効化（ボタンがクリック可能になるまで待機する）
             logger.info("Auto-Admit機能を有効化中...")
             self.meet_manager.enable_auto_admit()
 
@@ -154,7 +201,7 @@ class ReceptionController:
             self.communication_client.send_notification("受付システム準備完了")
 
             logger.info("受付セッションの開始が完了しました")
-            logger.info(f"Meet URL: {self.current_meet_url}")
+            logger.info("Meet URL: %s", self.current_meet_url)
 
             # 使用実績通知
             notify_usage(
@@ -169,7 +216,7 @@ class ReceptionController:
             return True
 
         except Exception as e:
-            logger.error(f"受付セッション開始エラー: {e}")
+            logger.error("受付セッション開始エラー: %s", e)
             notify_error(
                 e,
                 "受付セッション開始",
@@ -181,49 +228,53 @@ class ReceptionController:
                 },
                 location=SessionLocation.REMOTE,
             )
+            # セットアップ途中のドライバーや接続が解放後に残らないよう完了を待つ
+            wait(startup_futures)
             self.cleanup()
             return False
 
+    def _abort_startup(self, startup_futures: list[Future]) -> None:
+        """並行して開始した起動処理の完了を待ってから、確保した資源を解放"""
+        wait(startup_futures)
+        self.meet_manager.cleanup()
+        self.communication_client.release()
+        self._remove_gui_log_handler()
+
+    def _remove_gui_log_handler(self) -> None:
+        """GUIへのログ転送を終了"""
+        if self._gui_log_handler:
+            logger.removeHandler(self._gui_log_handler)
+            self._gui_log_handler.close()
+            self._gui_log_handler = None
+
     def wait_for_session_end(self) -> None:
         """セッション終了まで待機"""
         try:
             logger.info("受付セッション中... (Ctrl+Cで終了)")
-            heartbeat_counter = 0
-
-            while True:
-                time.sleep(1)
-                heartbeat_counter += 1
-
-                # セッション終了フラグのチェック
-                if self._session_ended:
-                    logger.info("Chrome終了により自動でセッションを終了します")
-                    break
-
-                # 20秒ごとにハートビートを送信
-                if heartbeat_counter >= 20:
-                    if self.communication_client.is_connected():
-                        self.communication_client.send_heartbeat()
-                    heartbeat_counter = 0
 
-                # Meetセッション状態チェック（従来の方法も残す）
-                if not self.meet_manager.is_session_active():
-                    logger.info(
-                        "Chromeが終了またはMeetから退出したため、セッションを終了します"
+            # Chrome終了・Meet退出はプロセス監視、通信切断は送信失敗時の
+            # コールバックで通知されるため、待機中は次のハートビート期限にのみ起床する
+            while not self._session_end_event.wait(
+                timeout=max(
+                    0.0,
+                    self.HEARTBEAT_INTERVAL - self.communication_client.idle_time(),
+                )
+            ):
+                if not self.communication_client.send_heartbeat_if_idle(
+                    min_gap=self.HEARTBEAT_INTERVAL
+                ):
+                    logger.warning(
+                        "ハートビート送信に失敗したため、セッションを終了します"
                     )
-                    if self.gui:
-                        self.gui.update_status(ConnectionStatus.DISCONNECTING)
-                        self.gui.add_log("Chromeが終了またはMeetから退出しました")
                     break
 
-                # 通信チェック
-                if not self.communication_client.is_connected():
-                    logger.warning("フロントPCとの通信が切断されました")
-                    break
+            if self._session_ended:
+                logger.info("Chrome終了により自動でセッションを終了します")
 
         except KeyboardInterrupt:
             logger.info("セッション終了要求を受信")
         except Exception as e:
-            logger.error(f"セッション中エラー: {e}")
+            logger.error("セッション中エラー: %s", e)
 
     def end_reception_session(self) -> None:
         """受付セッションを終了"""
@@ -231,37 +282,65 @@ class ReceptionController:
             logger.info("受付セッションを終了中...")
 
             # フロントPCに終了通知
-            if self.communication_client.is_connected():
-                self.communication_client.send_command(RemoteCommand.END_SESSION.value)
+            self.communication_client.send_command(RemoteCommand.END_SESSION.value)
 
             self.cleanup()
             logger.info("受付セッションを終了しました")
 
         except Exception as e:
-            logger.error(f"セッション終了エラー: {e}")
-
-    def cleanup(self) -> None:
-        """リソースのクリーンアップ"""
-        try:
-            # フロントPCに終了通知を送信（接続中の場合）
-            if self.communication_client.is_connected():
-                logger.info("フロントPCに終了通知を送信中...")
-                self.communication_client.send_command(RemoteCommand.END_SESSION.value)
-                time.sleep(1)  # 送信完了を待つ
+            logger.error("セッション終了エラー: %s", e)
 
-            # リソースのクリーンアップ
-            self.meet_manager.cleanup()
-            self.communication_client.disconnect()
+    def cleanup(self, prefetch_next: bool = False) -> None:
+        """リソースのクリーンアップ
 
-            # 共有Webドライバーのクリーンアップ
-            cleanup_webdriver()
+        Args:
+            prefetch_next: 次のセッション用のMeetスペースを事前に作成する
+                （GUIを続けて使う正常終了時のみ指定する）
+        """
+        if self._cleaned_up:
+            return
+        self._cleaned_up = True
+        # 待機中のセッション監視ループを終了させる
+        self._session_end_event.set()
+        try:
+            # フロントPCへの終了通知とブラウザの解放は互いに独立しているため並行して行う
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(self._cleanup_communication),
+                    executor.submit(self._cleanup_browser, prefetch_next),
+                ]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error("クリーンアップエラー: %s", e)
 
             # GUI状態を更新
             if self.gui:
                 self.gui.update_status(ConnectionStatus.NOT_CONNECTED)
-                self.gui.add_log("セッションを終了しました")
+            logger.info("セッションを終了しました")
         except Exception as e:
-            logger.error(f"クリーンアップエラー: {e}")
+            logger.error("クリーンアップエラー: %s", e)
+        finally:
+            self._remove_gui_log_handler()
+
+    def _cleanup_communication(self) -> None:
+        """フロントPCに終了通知を送信し、接続を解放（接続は次回再利用する）"""
+        if self.communication_client.send_command_sync(RemoteCommand.END_SESSION.value):
+            logger.info("フロントPCに終了通知を送信しました")
+        self.communication_client.release()
+
+    def _cleanup_browser(self, prefetch_next: bool) -> None:
+        """Meetから退出してブラウザを解放（Chromeは終了せず次回再利用する）"""
+        self.meet_manager.cleanup()
+        if prefetch_next:
+            # 次のセッションに備えてMeetスペースを事前に作成しておく
+            self.meet_manager.prefetch_meet_space()
+
+    @staticmethod
+    def shutdown_pool() -> None:
+        """セッション間で再利用しているChromeを終了（プロセス終了時に呼ぶ）"""
+        cleanup_webdriver()
 
     def run(self) -> None:
         """メイン実行処理"""
@@ -272,3 +351,4 @@ class ReceptionController:
                 logger.error("受付セッションの開始に失敗しました")
         finally:
             self.end_reception_session()
+            self.shutdown_pool()
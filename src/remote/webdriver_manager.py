@@ -5,6 +5,7 @@ remoteディレクトリ全体で共有するWebDriverマネージャー
 """
 
 import threading
+import time
 from logging import getLogger
 
 import psutil
@@ -20,72 +21,151 @@ logger = getLogger(__name__)
 
 
 class WebDriverManager:
-    """remote全体で共有するWebDriverマネージャー（Singleton）"""
+    """remote全体で共有するWebDriverマネージャー
 
-    _instance: "WebDriverManager | None" = None
-    _lock = threading.Lock()
+    インスタンスはモジュール末尾の webdriver_manager のみを使用する
+    （モジュールのimportは一度しか実行されないため、生成時のロックは不要）
+    """
 
     _driver: webdriver.Chrome | None = None
-    _driver_lock = threading.Lock()
+    # 状態変更の排他制御（Chrome起動中はロックを手放し、完了を通知する）
+    _driver_lock = threading.Condition()
+    _creating = False
     _reference_count = 0
     _chrome_pid: int | None = None
+    _chrome_process: psutil.Process | None = None
     _current_headless: bool | None = None
-
-    def __new__(cls):
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-            return cls._instance
+    _last_validated: float = 0.0
+    _driver_process: psutil.Process | None = None
+
+    # current_urlによる生存確認を省略する期間（秒）
+    VALIDATION_INTERVAL = 5.0
+
+    # Chrome起動オプション（ドライバー作成のたびに組み立て直さない）
+    _HEADLESS_ARGS: tuple[str, ...] = ("--headless=new",)
+    _HEADFUL_ARGS: tuple[str, ...] = (
+        # 言語設定
+        "--lang=ja",
+        # その他オプション
+        "--disable-blink-features=AutomationControlled",
+        "--disable-gpu",
+        # 起動時の初回セットアップや裏側の通信を省いて起動を速める
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--disable-background-networking",
+        "--disable-sync",
+        "--disable-default-apps",
+        "--metrics-recording-only",
+    )
+    _PLATFORM_ARGS: dict[Platform, tuple[str, ...]] = {
+        # ウィンドウサイズを指定
+        Platform.MACOS: ("--window-size=1920,1080",),
+        # 全画面モードで起動
+        Platform.WINDOWS: ("--start-fullscreen",),
+    }
+    _HEADFUL_PREFS: dict[str, object] = {
+        "intl.accept_languages": "ja,en-US,en",
+        "profile.default_content_setting_values.media_stream_mic": 1,
+        "profile.default_content_setting_values.media_stream_camera": 1,
+        "profile.default_content_setting_values.geolocation": 0,
+        "profile.default_content_setting_values.notifications": 2,
+    }
 
     def __init__(self):
-        # 初期化は一度だけ実行
-        if hasattr(self, "_initialized"):
-            return
-        self._initialized = True
-
         self.profile_dir = Config.CONFIG_DIR / "chrome-profile-remote"
-
-    def get_driver(self, headless: bool = False) -> webdriver.Chrome:
-        """共有WebDriverインスタンスを取得"""
+        # プロファイルディレクトリはプロセス中に消えないため作成は一度だけ行う
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        self._profile_dir_arg = f"--user-data-dir={self.profile_dir}"
+        self._chrome_name_lower = PlatformUtils.get_chrome_process_name().lower()
+
+    def get_driver(
+        self, headless: bool = False, validate: bool = False
+    ) -> webdriver.Chrome:
+        """共有WebDriverインスタンスを取得
+
+        Args:
+            headless: ヘッドレスモードで起動するか
+            validate: 直近に確認済みでもChromeDriverへの問い合わせで生存確認する
+        """
         with self._driver_lock:
             self._reference_count += 1
 
-            if self._driver is not None:
-                try:
-                    # 既存のドライバーが有効かチェック
-                    _ = self._driver.current_url
+            # 他のスレッドがChromeを起動中なら完了を待つ
+            while self._creating:
+                self._driver_lock.wait()
 
+            if self._driver is not None:
+                if (
+                    self._current_headless is not None
+                    and self._current_headless != headless
+                ):
                     # headless設定が変更されている場合は再作成
-                    if (
-                        self._current_headless is not None
-                        and self._current_headless != headless
-                    ):
-                        logger.info(
-                            f"headless設定が変更されたため、ドライバーを再作成します "
-                            f"(現在: {self._current_headless} -> 要求: {headless})"
-                        )
-                        self._cleanup_driver()
-                    else:
-                        logger.info(
-                            f"既存のWebDriverインスタンスを再利用 (参照カウント: {self._reference_count})"
-                        )
-                        return self._driver
-                except Exception:
+                    logger.info(
+                        f"headless設定が変更されたため、ドライバーを再作成します "
+                        f"(現在: {self._current_headless} -> 要求: {headless})"
+                    )
+                    self._cleanup_driver()
+                elif self._is_driver_alive(validate):
+                    logger.info(
+                        f"既存のWebDriverインスタンスを再利用 (参照カウント: {self._reference_count})"
+                    )
+                    return self._driver
+                else:
                     # 無効なドライバーをクリーンアップ
                     logger.info("既存のWebDriverが無効になっていたため、再作成します")
                     self._cleanup_driver()
 
-            # 新しいドライバーを作成
-            self._driver = self._create_driver(headless=headless)
+            # 作成中の印を付けてロックを手放す
+            self._creating = True
+
+        # Chromeの起動には時間がかかるため、ロックの外で新しいドライバーを作成
+        try:
+            driver = self._create_driver(headless=headless)
+        except Exception:
+            with self._driver_lock:
+                self._creating = False
+                self._reference_count -= 1
+                self._driver_lock.notify_all()
+            raise
+
+        with self._driver_lock:
+            self._driver = driver
             self._current_headless = headless
+            self._last_validated = time.monotonic()
             self._get_chrome_pid()
+            self._creating = False
+            self._driver_lock.notify_all()
             logger.info(
                 f"新しいWebDriverインスタンスを作成 (参照カウント: {self._reference_count})"
             )
-            return self._driver
+            return driver
 
-    def release_driver(self) -> None:
-        """WebDriverインスタンスの参照を解放"""
+    def _is_driver_alive(self, validate: bool = False) -> bool:
+        """既存のドライバーが使用可能か確認（直近に確認済みなら通信を省略）"""
+        process = getattr(self._driver.service, "process", None)
+        if process is not None and process.poll() is not None:
+            # ChromeDriverプロセスが終了している
+            return False
+
+        if (
+            not validate
+            and time.monotonic() - self._last_validated < self.VALIDATION_INTERVAL
+        ):
+            return True
+
+        try:
+            _ = self._driver.current_url
+        except Exception:
+            return False
+        self._last_validated = time.monotonic()
+        return True
+
+    def release_driver(self, keep_alive: bool = False) -> None:
+        """WebDriverインスタンスの参照を解放
+
+        Args:
+            keep_alive: 参照が0になってもChromeを終了せず、次回の取得で再利用する
+        """
         with self._driver_lock:
             if self._reference_count > 0:
                 self._reference_count -= 1
@@ -93,14 +173,37 @@ class WebDriverManager:
                     f"WebDriver参照を解放 (参照カウント: {self._reference_count})"
                 )
 
-                # 参照カウントが0になったらドライバーを終了
+                # 参照カウントが0になったらドライバーを終了（または待機状態にする）
                 if self._reference_count == 0:
-                    logger.info("全ての参照が解放されたため、WebDriverを終了します")
-                    self._cleanup_driver()
+                    if keep_alive and self._park_driver():
+                        logger.info("WebDriverを次回のセッション用に待機させます")
+                    else:
+                        logger.info("全ての参照が解放されたため、WebDriverを終了します")
+                        self._cleanup_driver()
+
+    def _park_driver(self) -> bool:
+        """タブを1つに戻して空白ページへ遷移し、ドライバーを再利用可能にする"""
+        if not self._driver:
+            return False
+        try:
+            handles = self._driver.window_handles
+            for handle in handles[1:]:
+                self._driver.switch_to.window(handle)
+                self._driver.close()
+            self._driver.switch_to.window(handles[0])
+            # ページを離れることでMeetからも退出する
+            self._driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.error(f"WebDriver待機処理エラー: {e}")
+            return False
 
     def force_cleanup(self) -> None:
         """強制的にWebDriverをクリーンアップ"""
         with self._driver_lock:
+            # 起動中のドライバーが取り残されないよう作成完了を待つ
+            while self._creating:
+                self._driver_lock.wait()
             self._reference_count = 0
             self._cleanup_driver()
             logger.info("WebDriverを強制終了しました")
@@ -110,42 +213,25 @@ class WebDriverManager:
         chrome_options = Options()
 
         # プロファイルディレクトリ設定
-        self.profile_dir.mkdir(parents=True, exist_ok=True)
-        chrome_options.add_argument(f"--user-data-dir={self.profile_dir}")
+        chrome_options.add_argument(self._profile_dir_arg)
         chrome_options.add_argument("--profile-directory=Default")
 
         if headless:
             # ヘッドレスモード設定
-            chrome_options.add_argument("--headless=new")
+            args = self._HEADLESS_ARGS
         else:
-            # ヘッドレスモードではない場合の設定
-            # 言語とメディア設定
-            chrome_options.add_argument("--lang=ja")
-            chrome_options.add_experimental_option(
-                "prefs",
-                {
-                    "intl.accept_languages": "ja,en-US,en",
-                    "profile.default_content_setting_values.media_stream_mic": 1,
-                    "profile.default_content_setting_values.media_stream_camera": 1,
-                    "profile.default_content_setting_values.geolocation": 0,
-                    "profile.default_content_setting_values.notifications": 2,
-                },
+            # ヘッドレスモードではない場合の設定（言語・メディア・自動化表示の抑制）
+            args = self._HEADFUL_ARGS + self._PLATFORM_ARGS.get(
+                PlatformUtils.get_platform(), ()
             )
-
-            # その他オプション
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+            chrome_options.add_experimental_option("prefs", self._HEADFUL_PREFS)
             chrome_options.add_experimental_option(
                 "excludeSwitches", ["enable-automation"]
             )
             chrome_options.add_experimental_option("useAutomationExtension", False)
-            chrome_options.add_argument("--disable-gpu")
 
-            if PlatformUtils.get_platform() == Platform.MACOS:
-                # ウィンドウサイズを指定
-                chrome_options.add_argument("--window-size=1920,1080")
-            elif PlatformUtils.get_platform() == Platform.WINDOWS:
-                # 全画面モードで起動
-                chrome_options.add_argument("--start-fullscreen")
+        for arg in args:
+            chrome_options.add_argument(arg)
 
         try:
             service = Service()
@@ -159,15 +245,26 @@ class WebDriverManager:
 
     def _get_chrome_pid(self) -> None:
         """ChromeプロセスのPIDを取得"""
+        # 同じChromeが生きている間は再探索しない
+        if self._chrome_pid and psutil.pid_exists(self._chrome_pid):
+            return
         try:
             if self._driver and hasattr(self._driver.service, "process"):
                 driver_pid = self._driver.service.process.pid
-                parent_process = psutil.Process(driver_pid)
-                chrome_process_name = PlatformUtils.get_chrome_process_name()
-                for child in parent_process.children(recursive=True):
-                    if chrome_process_name.lower() in child.name().lower():
-                        self._chrome_pid = child.pid
-                        break
+                if (
+                    self._driver_process is None
+                    or self._driver_process.pid != driver_pid
+                ):
+                    self._driver_process = psutil.Process(driver_pid)
+
+                # ChromeDriverの直接の子がブラウザ本体なので、まずは直下のみを確認し
+                # 見つからない場合だけ子孫全体を走査する
+                for recursive in (False, True):
+                    for child in self._driver_process.children(recursive=recursive):
+                        if self._chrome_name_lower in child.name().lower():
+                            self._chrome_pid = child.pid
+                            self._chrome_process = child
+                            return
         except Exception as e:
             logger.error(f"Chrome PID取得エラー: {e}")
 
@@ -181,7 +278,10 @@ class WebDriverManager:
             finally:
                 self._driver = None
                 self._chrome_pid = None
+                self._chrome_process = None
+                self._driver_process = None
                 self._current_headless = None
+                self._last_validated = 0.0
 
     def is_driver_active(self) -> bool:
         """WebDriverが有効かどうかを確認"""
@@ -197,20 +297,24 @@ class WebDriverManager:
         """Chrome プロセスのPIDを取得"""
         return self._chrome_pid
 
+    def get_chrome_process(self) -> psutil.Process | None:
+        """Chrome プロセスのハンドルを取得"""
+        return self._chrome_process
+
 
 # シングルトンインスタンス
 webdriver_manager = WebDriverManager()
 
 
 # 後方互換性のためのエイリアス関数
-def get_webdriver(headless: bool = False) -> webdriver.Chrome:
+def get_webdriver(headless: bool = False, validate: bool = False) -> webdriver.Chrome:
     """共有WebDriverインスタンスを取得"""
-    return webdriver_manager.get_driver(headless=headless)
+    return webdriver_manager.get_driver(headless=headless, validate=validate)
 
 
-def release_webdriver() -> None:
+def release_webdriver(keep_alive: bool = False) -> None:
     """共有WebDriverインスタンスの参照を解放"""
-    webdriver_manager.release_driver()
+    webdriver_manager.release_driver(keep_alive=keep_alive)
 
 
 def cleanup_webdriver() -> None:
@@ -226,3 +330,8 @@ def is_webdriver_active() -> bool:
 def get_webdriver_chrome_pid() -> int | None:
     """共有WebDriverのChrome PIDを取得"""
     return webdriver_manager.get_chrome_pid()
+
+
+def get_webdriver_chrome_process() -> psutil.Process | None:
+    """共有WebDriverのChromeプロセスハンドルを取得"""
+    return webdriver_manager.get_chrome_process()
@@ -2,9 +2,11 @@
 プラットフォーム判定と OS 固有処理のユーティリティ
 """
 
+import functools
 import logging
 import platform as platform_module
-import subprocess
+
+import psutil
 
 from ..models.enums import Platform, ProcessName
 
@@ -15,43 +17,44 @@ class PlatformUtils:
     """OS固有の処理を統一的に扱うためのユーティリティクラス"""
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_platform() -> Platform:
-        """現在のプラットフォームを取得"""
+        """現在のプラットフォームを取得（実行中に変わらないため結果をキャッシュ）"""
         system = platform_module.system()
         return Platform.from_system(system)
 
     @staticmethod
     def check_process_running(process_name: str) -> bool:
         """プロセスが実行中かどうかを確認"""
-        current_platform = PlatformUtils.get_platform()
+        return PlatformUtils.find_process_pid(process_name) is not None
+
+    @staticmethod
+    def find_process_pid(process_name: str) -> int | None:
+        """名前にprocess_nameを含む実行中プロセスのPIDを取得
 
+        tasklist / pgrep を起動せず、psutilでプロセス名を直接走査する
+        """
+        target = process_name.lower()
         try:
-            if current_platform == Platform.WINDOWS:
-                # Windowsではtasklistを使用
-                result = subprocess.run(
-                    ["tasklist", "/FI", f"IMAGENAME eq {process_name}*"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                return process_name.lower() in result.stdout.lower()
-            else:
-                # macOS/Linuxではpgrepを使用
-                result = subprocess.run(
-                    ["pgrep", "-f", process_name],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                return result.returncode == 0
-        except subprocess.TimeoutExpired:
-            logger.error(f"Timeout while checking process: {process_name}")
-            return False
+            for process in psutil.process_iter(["name"]):
+                name = process.info["name"]
+                if name and target in name.lower():
+                    return process.pid
+            return None
         except Exception as e:
             logger.error(f"Error checking process {process_name}: {e}")
+            return None
+
+    @staticmethod
+    def is_process_alive(pid: int, process_name: str) -> bool:
+        """指定PIDのプロセスがprocess_nameを含む名前で実行中かを確認"""
+        try:
+            return process_name.lower() in psutil.Process(pid).name().lower()
+        except psutil.Error:
             return False
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_chrome_process_name() -> str:
         """プラットフォーム別のChromeプロセス名を取得"""
         current_platform = PlatformUtils.get_platform()
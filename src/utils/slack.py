@@ -1,16 +1,51 @@
 """Slack通知機能"""
 
+import atexit
 import os
+import queue
+import random
+import threading
+import time
 import traceback
-from datetime import datetime
+from collections.abc import Callable
 from enum import Enum
 from typing import Any
 
-import requests
+import httpx
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Webhook URL（起動時に一度だけ環境変数から取得）
+_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL")
+
+# Webhook送信用のクライアント（TLS接続を通知間で使い回す）
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+# レート制限（429）やSlack側の一時的なエラーはRetry-Afterに従って再送する
+SLACK_MAX_RETRIES = 3
+SLACK_RETRY_BACKOFF = 0.5
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# 送信待ち通知のキュー（呼び出し元をSlackの応答待ちでブロックしない）
+SLACK_QUEUE_MAXSIZE = 256
+# 短時間に続いた通知は1回の送信にまとめる（待機秒数と最大件数）
+SLACK_COALESCE_WINDOW = 0.5
+SLACK_BATCH_MAX = 20
+_slack_queue: queue.Queue[tuple[str, dict[str, Any], str, str]] = queue.Queue(
+    maxsize=SLACK_QUEUE_MAXSIZE
+)
+_worker: threading.Thread | None = None
+_worker_lock = threading.Lock()
+
+# Slackが応答しない間は送信を一時停止する（連続失敗回数と停止秒数）
+SLACK_BREAKER_THRESHOLD = 5
+SLACK_BREAKER_COOLDOWN = 60
+_breaker_failures = 0
+_breaker_opened_at: float | None = None
+_breaker_lock = threading.Lock()
+
 
 class NotificationType(Enum):
     """通知タイプ"""
@@ -35,117 +70,313 @@ class MeetEndReason(Enum):
     DISCONNECT = "接続切断"
 
 
-def send_slack_notification(
+# 通知タイプごとの色
+_COLOR_BY_TYPE = {
+    NotificationType.INFO: "#2196F3",  # 青色
+    NotificationType.ERROR: "danger",  # 赤色
+}
+
+# 実行場所ごとの絵文字付きタイトル
+_LOCATION_TITLE = {
+    SessionLocation.FRONT: "🏨 フロントPC",
+    SessionLocation.REMOTE: "🧑‍💻 リモートPC",
+}
+
+_FOOTER = "VTuber Reception System - Ribura Inc."
+
+
+def reload_config() -> None:
+    """環境変数からWebhook URLを再読み込み"""
+    global _WEBHOOK_URL
+    _WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL")
+
+
+def _get_client() -> httpx.Client:
+    """Webhook送信用の共有クライアントを取得（初回のみ作成）"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                timeout=10.0,
+                # 独自のトランスポートを渡すとClientのlimitsは使われないため、
+                # 接続数の上限はトランスポート側に指定する
+                # （接続確立の失敗もトランスポート側で再試行する）
+                transport=httpx.HTTPTransport(
+                    retries=SLACK_MAX_RETRIES,
+                    limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+                ),
+            )
+        return _client
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """再送までの待機秒数（Retry-Afterと指数バックオフの長い方）"""
+    try:
+        retry_after = float(response.headers.get("Retry-After", 0))
+    except ValueError:
+        retry_after = 0.0
+    backoff = SLACK_RETRY_BACKOFF * 2**attempt
+    return max(retry_after, backoff) + random.uniform(0, 0.25)
+
+
+def _post_with_retry(webhook_url: str, payload: dict[str, Any]) -> httpx.Response:
+    """Webhookへ送信し、429や5xxの場合は待機して再送"""
+    attempt = 0
+    while True:
+        response = _get_client().post(webhook_url, json=payload)
+        if response.status_code not in _RETRY_STATUSES or attempt >= SLACK_MAX_RETRIES:
+            return response
+        time.sleep(_retry_delay(response, attempt))
+        attempt += 1
+
+
+def _build_payload(
     notification_type: NotificationType,
     title: str,
     message: str,
-    details: dict[str, Any] | None = None,
-    error_traceback: str | None = None,
-    location: SessionLocation | None = None,
-) -> None:
-    """
-    Slack通知を送信
+    details: dict[str, Any] | None,
+    error_traceback: str | None,
+    location: SessionLocation | None,
+) -> dict[str, Any]:
+    """Slackに送信するペイロードを構築"""
+    # 現在時刻
+    now = time.strftime("%Y-%m-%d %H:%M:%S")
+
+    # 通知タイプに応じた色
+    color = _COLOR_BY_TYPE[notification_type]
+
+    # タイトルの構築（実行場所が指定されている場合は場所情報をタイトルにする）
+    display_title = _LOCATION_TITLE[location] if location else title
+
+    # フィールドを構築
+    fields = []
+
+    # 詳細情報があれば追加
+    if details:
+        for key, value in details.items():
+            fields.append({"title": key, "value": str(value), "short": False})
+
+    # 基本フィールドを追加
+    fields.extend(
+        [
+            {"title": "実行時刻", "value": now, "short": False},
+        ]
+    )
 
-    Args:
-        notification_type: 通知タイプ（INFO/ERROR）
-        title: 通知タイトル
-        message: メインメッセージ
-        details: 追加詳細情報（辞書形式）
-        error_traceback: エラーのトレースバック情報
-        location: セッション実行場所（front/remote）
-    """
-    # Webhook URLを環境変数から取得（デフォルト値あり）
-    webhook_url = os.getenv("SLACK_WEBHOOK_URL")
+    # エラーの場合、トレースバックを追加
+    if notification_type == NotificationType.ERROR and error_traceback:
+        # トレースバックを制限（Slackの制限対策）
+        # 原因に近い末尾のフレームが有用なため、長い場合は後ろ側を残す
+        if len(error_traceback) <= 2000:
+            truncated_traceback = error_traceback
+        else:
+            lines = error_traceback.splitlines(keepends=True)
+            truncated_traceback = "... (truncated)\n" + "".join(lines[-40:])[-2000:]
+
+        fields.append(
+            {
+                "title": "エラー詳細",
+                "value": f"```{truncated_traceback}```",
+                "short": False,
+            }
+        )
 
-    if not webhook_url:
-        print(f"Slack Webhook URLが設定されていません: {title} - {message}")
+    # ペイロード構築
+    return {
+        "attachments": [
+            {
+                "color": color,
+                "fallback": f"{display_title}: {message}",
+                "title": display_title,
+                "text": message,
+                "fields": fields,
+                "footer": _FOOTER,
+            }
+        ]
+    }
+
+
+def _post_payload(
+    webhook_url: str, payload: dict[str, Any], title: str, message: str
+) -> None:
+    """構築済みのペイロードをSlack Webhookへ送信"""
+    if not _breaker_allows():
+        print(f"Slack通知を一時停止中のため送信しません: {title} - {message}")
         return
 
     try:
-        # 現在時刻
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        # 実行場所に応じた絵文字とタイトル
-        if location == SessionLocation.FRONT:
-            location_emoji = "🏨"
-            location_title = "フロントPC"
-        elif location == SessionLocation.REMOTE:
-            location_emoji = "🧑‍💻"
-            location_title = "リモートPC"
+        response = _post_with_retry(webhook_url, payload)
+
+        # レスポンスチェック
+        if response.status_code == 200:
+            _record_result(success=True)
+            print(f"Slack通知送信完了: {title} - {message}")
         else:
-            location_emoji = ""
-            location_title = ""
-
-        # 通知タイプに応じた色とアイコン
-        if notification_type == NotificationType.INFO:
-            color = "#2196F3"  # 青色
-        else:  # ERROR
-            color = "danger"  # 赤色
-
-        # タイトルの構築（実行場所が指定されている場合は場所情報を先頭に追加）
-        display_title = f"{location_emoji} {location_title}" if location else title
-
-        # フィールドを構築
-        fields = []
-
-        # 詳細情報があれば追加
-        if details:
-            for key, value in details.items():
-                fields.append({"title": key, "value": str(value), "short": False})
-
-        # 基本フィールドを追加
-        fields.extend(
-            [
-                {"title": "実行時刻", "value": now, "short": False},
-            ]
-        )
+            _record_result(success=False)
+            print(f"Slack通知送信失敗: {response.status_code} - {response.text}")
+
+    except Exception as e:
+        _record_result(success=False)
+        print(f"Slack通知送信エラー: {e}")
+        # 通知失敗してもメイン処理は継続
+
+
+def _breaker_allows() -> bool:
+    """送信を試みてよいかを判定（停止期間が過ぎたら1件だけ試行させる）"""
+    with _breaker_lock:
+        if _breaker_opened_at is None:
+            return True
+        return time.monotonic() - _breaker_opened_at >= SLACK_BREAKER_COOLDOWN
+
+
+def _record_result(success: bool) -> None:
+    """送信結果を記録し、連続して失敗した場合は送信を停止"""
+    global _breaker_failures, _breaker_opened_at
+    with _breaker_lock:
+        if success:
+            _breaker_failures = 0
+            _breaker_opened_at = None
+            return
+
+        _breaker_failures += 1
+        if _breaker_failures >= SLACK_BREAKER_THRESHOLD:
+            if _breaker_opened_at is None:
+                print(
+                    f"Slack通知が{_breaker_failures}回続けて失敗したため一時停止します"
+                )
+            _breaker_opened_at = time.monotonic()
 
-        # エラーの場合、トレースバックを追加
-        if notification_type == NotificationType.ERROR and error_traceback:
-            # トレースバックを制限（Slackの制限対策）
-            truncated_traceback = error_traceback[:2000]
-            if len(error_traceback) > 2000:
-                truncated_traceback += "\n... (truncated)"
-
-            fields.append(
-                {
-                    "title": "エラー詳細",
-                    "value": f"```{truncated_traceback}```",
-                    "short": False,
-                }
-            )
 
-        # ペイロード構築
+def _post_batch(items: list[tuple[str, dict[str, Any], str, str]]) -> None:
+    """複数の通知をWebhookごとに1つのメッセージへまとめて送信"""
+    by_webhook: dict[str, list[tuple[str, dict[str, Any], str, str]]] = {}
+    for item in items:
+        by_webhook.setdefault(item[0], []).append(item)
+
+    for webhook_url, group in by_webhook.items():
+        if len(group) == 1:
+            _post_payload(*group[0])
+            continue
+
         payload = {
             "attachments": [
-                {
-                    "color": color,
-                    "fallback": f"{display_title}: {message}",
-                    "title": display_title,
-                    "text": message,
-                    "fields": fields,
-                    "footer": "VTuber Reception System - Ribura Inc.",
-                }
+                attachment
+                for _, item_payload, _, _ in group
+                for attachment in item_payload["attachments"]
             ]
         }
+        titles = ", ".join(title for _, _, title, _ in group)
+        _post_payload(webhook_url, payload, f"{len(group)}件", titles)
+
+
+def _worker_loop() -> None:
+    """キューに積まれた通知を順に送信（続けて届いた通知はまとめる）"""
+    while True:
+        batch = [_slack_queue.get()]
+        try:
+            while len(batch) < SLACK_BATCH_MAX:
+                try:
+                    batch.append(_slack_queue.get(timeout=SLACK_COALESCE_WINDOW))
+                except queue.Empty:
+                    break
+            _post_batch(batch)
+        finally:
+            for _ in batch:
+                _slack_queue.task_done()
+
+
+def _ensure_worker() -> None:
+    """送信ワーカースレッドを必要に応じて起動"""
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_worker_loop, name="slack-notifier", daemon=True
+            )
+            _worker.start()
 
-        # Slack Webhook送信
-        response = requests.post(
-            webhook_url,
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=10,
-        )
 
-        # レスポンスチェック
-        if response.status_code == 200:
-            print(f"Slack通知送信完了: {title} - {message}")
-        else:
-            print(f"Slack通知送信失敗: {response.status_code} - {response.text}")
+def _drain_queue() -> None:
+    """終了時に未送信の通知を同期的に送り切る"""
+    while True:
+        batch = []
+        while len(batch) < SLACK_BATCH_MAX:
+            try:
+                batch.append(_slack_queue.get_nowait())
+            except queue.Empty:
+                break
+        if not batch:
+            return
+        try:
+            _post_batch(batch)
+        finally:
+            for _ in batch:
+                _slack_queue.task_done()
+
+
+atexit.register(_drain_queue)
+
 
+def _prepare(
+    notification_type: NotificationType,
+    title: str,
+    message: str,
+    details: dict[str, Any] | None,
+    error_traceback: str | Callable[[], str] | None,
+    location: SessionLocation | None,
+) -> tuple[str, dict[str, Any], str, str] | None:
+    """送信に必要な情報をまとめる（Webhook未設定の場合はNone）"""
+    webhook_url = _WEBHOOK_URL
+
+    if not webhook_url:
+        print(f"Slack Webhook URLが設定されていません: {title} - {message}")
+        return None
+
+    try:
+        # トレースバックは実際に送信するエラー通知の場合のみ整形する
+        if notification_type == NotificationType.ERROR and callable(error_traceback):
+            error_traceback = error_traceback()
+        payload = _build_payload(
+            notification_type, title, message, details, error_traceback, location
+        )
     except Exception as e:
         print(f"Slack通知送信エラー: {e}")
-        # 通知失敗してもメイン処理は継続
+        return None
+    return webhook_url, payload, title, message
+
+
+def send_slack_notification(
+    notification_type: NotificationType,
+    title: str,
+    message: str,
+    details: dict[str, Any] | None = None,
+    error_traceback: str | Callable[[], str] | None = None,
+    location: SessionLocation | None = None,
+) -> None:
+    """
+    Slack通知を送信
+
+    送信はバックグラウンドのワーカースレッドで行い、呼び出し元は待たない。
+
+    Args:
+        notification_type: 通知タイプ（INFO/ERROR）
+        title: 通知タイトル
+        message: メインメッセージ
+        details: 追加詳細情報（辞書形式）
+        error_traceback: エラーのトレースバック情報（整形する関数も可）
+        location: セッション実行場所（front/remote）
+    """
+    item = _prepare(
+        notification_type, title, message, details, error_traceback, location
+    )
+    if item is None:
+        return
+
+    _ensure_worker()
+    try:
+        _slack_queue.put_nowait(item)
+    except queue.Full:
+        print(f"Slack通知キューが満杯のため破棄しました: {title} - {message}")
 
 
 def notify_usage(
@@ -223,9 +454,6 @@ def notify_error(
         additional_info: 追加情報
         location: セッション実行場所（front/remote）
     """
-    # エラートレースバックを取得
-    error_traceback = traceback.format_exc()
-
     # エラー詳細を構築
     details = {
         "エラー種別": type(error).__name__,
@@ -240,6 +468,6 @@ def notify_error(
         title="受付システムエラー",
         message=str(error),
         details=details,
-        error_traceback=error_traceback,
+        error_traceback=traceback.format_exc,
         location=location,
     )
@@ -3,20 +3,59 @@ Tailscale関連ユーティリティ
 Tailscaleの設定確認とIPアドレス取得
 """
 
+import functools
+import http.client
 import json
 import logging
 import os
+import socket
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
 
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """Unixドメインソケット上のHTTP接続"""
+
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("local-tailscaled.sock", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
 class TailscaleUtils:
     """Tailscale関連の操作を管理するユーティリティクラス"""
 
+    # ステータスのキャッシュ有効期間（秒）
+    STATUS_CACHE_TTL = 30
+
+    # tailscaled の LocalAPI ソケット（Linux / macOS のオープンソース版）
+    LOCALAPI_SOCKET_PATHS = (
+        "/var/run/tailscale/tailscaled.sock",
+        "/var/run/tailscaled.socket",
+    )
+
+    _status_cache: dict | None = None
+    _status_cached_at: float = 0.0
+    _devices_cache: dict[str, str] | None = None
+    _cache_lock = threading.Lock()
+
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def _get_tailscale_command() -> str:
-        """適切なTailscaleコマンドパスを取得"""
+        """適切なTailscaleコマンドパスを取得（実行中に変わらないため結果をキャッシュ）"""
         # macOSの場合、アプリケーション内のバイナリを確認
         if os.path.exists("/Applications/Tailscale.app/Contents/MacOS/Tailscale"):
             return "/Applications/Tailscale.app/Contents/MacOS/Tailscale"
@@ -24,9 +63,70 @@ class TailscaleUtils:
             # 他の環境では通常のコマンドを使用
             return "tailscale"
 
+    @classmethod
+    def _get_cached_status(cls) -> dict | None:
+        """有効期間内のキャッシュ済みステータスを取得"""
+        with cls._cache_lock:
+            if (
+                cls._status_cache is not None
+                and time.monotonic() - cls._status_cached_at < cls.STATUS_CACHE_TTL
+            ):
+                return cls._status_cache
+            return None
+
+    @classmethod
+    def _set_cache(cls, status: dict) -> None:
+        """ステータスをキャッシュし、派生データを破棄"""
+        with cls._cache_lock:
+            cls._status_cache = status
+            cls._status_cached_at = time.monotonic()
+            cls._devices_cache = None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_localapi_socket() -> str | None:
+        """利用可能なLocalAPIソケットのパスを取得"""
+        if not hasattr(socket, "AF_UNIX"):
+            return None
+        for path in TailscaleUtils.LOCALAPI_SOCKET_PATHS:
+            if os.path.exists(path):
+                return path
+        return None
+
+    @staticmethod
+    def _get_status_via_localapi() -> dict | None:
+        """LocalAPIからステータスを取得（サブプロセスを起動しない）"""
+        socket_path = TailscaleUtils._get_localapi_socket()
+        if socket_path is None:
+            return None
+
+        conn = _UnixHTTPConnection(socket_path, timeout=3)
+        try:
+            conn.request("GET", "/localapi/v0/status")
+            response = conn.getresponse()
+            body = response.read()
+            if response.status != 200:
+                logger.debug(f"Tailscale LocalAPI status failed: {response.status}")
+                return None
+            return json.loads(body)
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            logger.debug(f"Tailscale LocalAPI unavailable: {e}")
+            return None
+        finally:
+            conn.close()
+
     @staticmethod
     def _get_status_data() -> dict | None:
-        """Tailscaleステータスを取得"""
+        """Tailscaleステータスを取得（取得に成功した結果は一定時間キャッシュ）"""
+        cached = TailscaleUtils._get_cached_status()
+        if cached is not None:
+            return cached
+
+        status = TailscaleUtils._get_status_via_localapi()
+        if status is not None:
+            TailscaleUtils._set_cache(status)
+            return status
+
         try:
             tailscale_cmd = TailscaleUtils._get_tailscale_command()
             result = subprocess.run(
@@ -41,6 +141,7 @@ class TailscaleUtils:
                 return None
 
             status = json.loads(result.stdout)
+            TailscaleUtils._set_cache(status)
             return status
 
         except Exception as e:
@@ -79,6 +180,14 @@ class TailscaleUtils:
     @staticmethod
     def get_my_tailscale_ip() -> str | None:
         """自分のTailscale IPアドレスを取得"""
+        # ステータスに含まれる自分のIPを優先し、サブプロセスの起動を避ける
+        status = TailscaleUtils._get_status_data()
+        if status:
+            for ip in status.get("Self", {}).get("TailscaleIPs", []):
+                if "." in ip:
+                    logger.info(f"My Tailscale IP: {ip}")
+                    return ip
+
         try:
             tailscale_cmd = TailscaleUtils._get_tailscale_command()
             result = subprocess.run(
@@ -105,6 +214,14 @@ class TailscaleUtils:
             if not status:
                 return {}
 
+            # 同じステータスから作成済みの一覧があればそれを返す
+            with TailscaleUtils._cache_lock:
+                if (
+                    TailscaleUtils._devices_cache is not None
+                    and status is TailscaleUtils._status_cache
+                ):
+                    return TailscaleUtils._devices_cache
+
             devices = {}
 
             # ピアデバイスの情報を取得
@@ -123,6 +240,9 @@ class TailscaleUtils:
                     devices[hostname] = tailscale_ips[0]
 
             logger.info(f"Found {len(devices)} Tailscale devices")
+            with TailscaleUtils._cache_lock:
+                if status is TailscaleUtils._status_cache:
+                    TailscaleUtils._devices_cache = devices
             return devices
 
         except Exception as e:
@@ -162,12 +282,21 @@ class TailscaleUtils:
         """
         try:
             # 1. Tailscaleコマンドの存在確認
+            # ステータス取得は互いに独立しているため並行して行い、
+            # 以降の確認はキャッシュされたステータスを使う
             tailscale_cmd = TailscaleUtils._get_tailscale_command()
 
-            try:
-                subprocess.run(
-                    [tailscale_cmd, "--version"], capture_output=True, timeout=3
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                version_future = executor.submit(
+                    subprocess.run,
+                    [tailscale_cmd, "--version"],
+                    capture_output=True,
+                    timeout=3,
                 )
+                executor.submit(TailscaleUtils._get_status_data)
+
+            try:
+                version_future.result()
             except FileNotFoundError:
                 return False, "Tailscaleがインストールされていません"
 
@@ -3,6 +3,7 @@ VTube Studio関連ユーティリティ
 VTube Studioの実行状態確認
 """
 
+import functools
 import logging
 import os
 import subprocess
@@ -10,20 +11,65 @@ import threading
 import time
 from pathlib import Path
 
-from ..models.enums import Platform
+from ..models.enums import Platform, ProcessName
 from .platform_utils import PlatformUtils
 from .slack import SessionLocation, notify_error
 
 logger = logging.getLogger(__name__)
 
+# 起動確認に成功した結果を再利用する期間（秒）
+VTUBE_CHECK_CACHE_TTL = 60
+_last_success_time: float | None = None
+
+# 起動後にプロセスの出現を待つ最大秒数
+VTUBE_LAUNCH_TIMEOUT = 13
+
+# プロセス走査結果を再利用する期間（秒）
+PROCESS_CHECK_CACHE_TTL = 0.5
+_process_check_cache: tuple[float, bool] | None = None
+# プロセス名の照合に使う名前（Windowsの "VTube Studio.exe" にも部分一致する）
+_VTUBE_STUDIO_NAME = ProcessName.VTUBE_STUDIO.value
+# 直近に見つかったVTube StudioのPID（まずこのPIDだけを確認する）
+_last_pid: int | None = None
+
 
 def _check_vtube_studio_running() -> bool:
-    """VTube Studioプロセスが実行中かを確認"""
-    return PlatformUtils.check_process_running("VTube Studio")
+    """VTube Studioプロセスが実行中かを確認（直近の走査結果は再利用）"""
+    global _process_check_cache
+
+    now = time.monotonic()
+    if (
+        _process_check_cache is not None
+        and now - _process_check_cache[0] < PROCESS_CHECK_CACHE_TTL
+    ):
+        return _process_check_cache[1]
+
+    running = _find_vtube_studio()
+    _process_check_cache = (now, running)
+    return running
+
+
+def _find_vtube_studio() -> bool:
+    """前回のPIDを優先して確認し、見つからない場合のみ全プロセスを走査"""
+    global _last_pid
+
+    if _last_pid is not None and PlatformUtils.is_process_alive(
+        _last_pid, _VTUBE_STUDIO_NAME
+    ):
+        return True
+
+    _last_pid = PlatformUtils.find_process_pid(_VTUBE_STUDIO_NAME)
+    return _last_pid is not None
+
+
+def _invalidate_process_check() -> None:
+    """プロセス走査結果のキャッシュを破棄"""
+    global _process_check_cache
+    _process_check_cache = None
 
 
 def _launch_vtube_studio() -> bool:
-    """VTube Studioを起動"""
+    """VTube Studioを起動（起動の完了は待たない）"""
     try:
         current_platform = PlatformUtils.get_platform()
         if current_platform == Platform.WINDOWS:
@@ -37,7 +83,15 @@ def _launch_vtube_studio() -> bool:
             vtube_path = os.path.expanduser(
                 "~/Library/Application Support/Steam/steamapps/common/VTube Studio/VTubeStudio.app"
             )
-            subprocess.Popen(["open", vtube_path])
+            # バッチ起動と同様に標準入出力を引き継がず、即座に切り離す
+            subprocess.Popen(
+                ["open", vtube_path],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+                start_new_session=True,
+            )
         else:
             logger.error(
                 f"Unsupported platform for launching applications: {current_platform}"
@@ -45,10 +99,9 @@ def _launch_vtube_studio() -> bool:
             return False
 
         logger.info(f"Successfully launched: {vtube_path}")
-
-        # 起動まで少し待機
-        time.sleep(3)
-        return _check_vtube_studio_running()
+        # 起動前の「未起動」結果を使わないようにする
+        _invalidate_process_check()
+        return True
 
     except Exception as e:
         logger.error(f"Failed to launch VTube Studio: {e}")
@@ -63,27 +116,71 @@ def check_and_setup_vtube_studio() -> tuple[bool, str]:
     Returns:
         (success, message): 成功フラグとメッセージ
     """
+    global _last_success_time
+
+    # 直近の確認で起動済みだった場合はプロセス走査を省略する
+    if (
+        _last_success_time is not None
+        and time.monotonic() - _last_success_time < VTUBE_CHECK_CACHE_TTL
+    ):
+        return True, "VTube Studio is running (cached)"
+
+    success, message = _check_and_setup_vtube_studio()
+    # 失敗は次回すぐに再確認できるよう成功時のみ記録する
+    _last_success_time = time.monotonic() if success else None
+    return success, message
+
+
+def _check_and_setup_vtube_studio() -> tuple[bool, str]:
+    """VTube Studioの実行状態を確認し、必要に応じて起動（キャッシュなし）"""
     if _check_vtube_studio_running():
         return True, "VTube Studio is running"
 
     logger.info("VTube Studio not running, attempting to launch...")
 
     if _launch_vtube_studio():
-        # 起動後の確認（最大10秒待機）
-        for _i in range(10):
-            time.sleep(1)
-            if _check_vtube_studio_running():
-                return True, "VTube Studio launched successfully"
+        if _wait_for_vtube_studio(VTUBE_LAUNCH_TIMEOUT):
+            return True, "VTube Studio launched successfully"
 
         return False, "VTube Studio launched but process not detected"
     else:
         return False, "Failed to launch VTube Studio"
 
 
+def _wait_for_vtube_studio(timeout: float) -> bool:
+    """VTube Studioのプロセスが現れるまで待機（現れた時点ですぐに戻る）"""
+    deadline = time.monotonic() + timeout
+    # 起動直後は短い間隔で確認し、徐々に間隔を広げる
+    delay = 0.05
+    while True:
+        if _check_vtube_studio_running():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 1.6, 0.4)
+
+
 # Windows専用のフラグ（.bat起動用）
 CREATE_NEW_CONSOLE: int = 0x00000010
 DETACHED_PROCESS: int = 0x00000008
 CREATE_NO_WINDOW: int = 0x08000000
+_DETACHED_FLAGS: int = DETACHED_PROCESS | CREATE_NO_WINDOW
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_bat(dir_path: str | Path, bat_name: str) -> tuple[Path, Path]:
+    """作業ディレクトリと .bat の絶対パスを解決して検証（成功した結果はキャッシュ）"""
+    cwd: Path = Path(dir_path).resolve()
+    bat_path: Path = (cwd / bat_name).resolve()
+
+    if not bat_path.exists():
+        raise FileNotFoundError(str(bat_path))
+    if bat_path.suffix.lower() != ".bat":
+        raise ValueError("bat_name には拡張子 .bat を指定すること")
+
+    return cwd, bat_path
 
 
 def run_bat_in_thread(
@@ -111,34 +208,30 @@ def run_bat_in_thread(
         FileNotFoundError: .bat ファイルが存在しない場合
         ValueError: bat_name が .bat でない場合
     """
-    cwd: Path = Path(dir_path).resolve()
-    bat_path: Path = (cwd / bat_name).resolve()
-
-    if not bat_path.exists():
-        raise FileNotFoundError(str(bat_path))
-    if bat_path.suffix.lower() != ".bat":
-        raise ValueError("bat_name には拡張子 .bat を指定すること")
+    cwd, bat_path = _resolve_bat(dir_path, bat_name)
 
     argv: list[str] = ["cmd.exe", "/c", "call", str(bat_path), *(args or [])]
-    creationflags: int = (
-        DETACHED_PROCESS | CREATE_NO_WINDOW if detached else CREATE_NEW_CONSOLE
-    )
-
-    def _target() -> None:
-        # ここで起動を実施（非同期・別スレッド）
-        subprocess.Popen(
-            argv,
-            cwd=str(cwd),
-            creationflags=creationflags,
-            stdin=subprocess.DEVNULL,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            close_fds=True,
-            shell=False,
-        )
+    creationflags: int = _DETACHED_FLAGS if detached else CREATE_NEW_CONSOLE
 
     th = threading.Thread(
-        target=_target, name=f"bat-launch:{bat_path.name}", daemon=True
+        target=_spawn_bat,
+        args=(argv, cwd, creationflags),
+        name=f"bat-launch:{bat_path.name}",
+        daemon=True,
     )
     th.start()
     return th
+
+
+def _spawn_bat(argv: list[str], cwd: Path, creationflags: int) -> None:
+    """.bat を起動（run_bat_in_thread の起動スレッドから呼ばれる）"""
+    subprocess.Popen(
+        argv,
+        cwd=str(cwd),
+        creationflags=creationflags,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True,
+        shell=False,
+    )